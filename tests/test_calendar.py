@@ -28,6 +28,7 @@ from xclim.core.calendar import (
     max_doy,
     parse_offset,
     percentile_doy,
+    resample_doy,
     time_bnds,
 )
 
@@ -140,6 +141,24 @@ def test_percentile_doy_no_copy(tas_series, use_dask):
     assert not np.testing.assert_array_equal(original_tas, tas)
 
 
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_resample_doy(tas_series, use_dask):
+    tas = tas_series(np.arange(365 * 3), start="1/1/2001")
+    doy = xr.DataArray(
+        np.arange(1.0, 367),
+        dims=("dayofyear",),
+        coords={"dayofyear": np.arange(1, 367)},
+    )
+    if use_dask:
+        tas = tas.chunk(dict(time=100))
+    out = resample_doy(doy, tas)
+    np.testing.assert_array_equal(out, tas.time.dt.dayofyear)
+    np.testing.assert_array_equal(out.time, tas.time)
+    if use_dask:
+        # Same time chunks as the target array
+        assert out.chunks == tas.chunks
+
+
 def test_percentile_doy_invalid():
     tas = xr.DataArray(
         [0, 1],
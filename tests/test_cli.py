@@ -232,6 +232,7 @@ def test_missing_variable(tas_series, tmp_path):
         (["--dask-nthreads", "2"], "Error: '--dask-maxmem' must be given"),
         (["--chunks", "time:90"], "100% Complete"),
         (["--chunks", "time:90,lat:5"], "100% Completed"),
+        (["--chunks", "time:-1,lat:auto"], "100% Completed"),
         (["--version"], xclim.__version__),
     ],
 )
@@ -23,6 +23,31 @@ def test_prefix_attrs():
     assert out == source
 
 
+def test_parse_doc():
+    from xclim.indices import tg_mean
+
+    meta = fmt.parse_doc(tg_mean.__doc__)
+    assert meta["title"] == "Mean of daily average temperature."
+    assert set(meta["parameters"]) == {"tas", "freq"}
+
+    # Results are cached, but modifying them must not affect later calls.
+    meta.pop("title")
+    meta["parameters"]["tas"]["units"] = "K"
+    meta = fmt.parse_doc(tg_mean.__doc__)
+    assert "title" in meta
+    assert "units" not in meta["parameters"]["tas"]
+
+
+def test_attr_formatter_matches():
+    fmt_ = fmt.AttrFormatter(
+        {"AS-*": ["annuel", "annuelle"], "MS": ["mensuel", "mensuelle"]}, ["m", "f"]
+    )
+    for _ in range(2):
+        assert fmt_.format("{freq:f}", freq="AS-JUL") == "annuelle"
+        assert fmt_.format("{freq}", freq="MS") == "mensuel"
+        assert fmt_.format("{freq}", freq="D") == "D"
+
+
 def test_indicator_docstring():
     doc = heat_wave_frequency.__doc__.split("\n")
     assert doc[0] == "Heat wave frequency (realm: atmos)"
@@ -36,6 +36,39 @@ class TestThresholdCount:
         out = generic.threshold_count(ts, "<", 50, "Y")
         np.testing.assert_array_equal(out, [50, 0])
 
+    @pytest.mark.parametrize("op", [">", "<", ">=", "<=", "==", "!="])
+    @pytest.mark.parametrize("chunks", [None, {"time": -1}, {"time": 100}])
+    def test_ops_nan(self, tas_series, op, chunks):
+        ts = tas_series(np.arange(800.0) % 10, start="2000-01-01")
+        ts[[5, 400]] = np.nan
+        exp = (
+            generic.compare(ts, op, 5)
+            .resample(time="MS")
+            .map(lambda c: c.sum(dim="time"))
+        )
+        if chunks:
+            ts = ts.chunk(chunks)
+        out = generic.threshold_count(ts, op, 5, "MS", constrain=[op])
+        np.testing.assert_array_equal(out, exp)
+
+    @pytest.mark.parametrize("op", [">", "<", ">=", "<="])
+    def test_float32(self, tas_series, op):
+        # 273.15 is not exactly representable in float32, values are compared as numpy does
+        ts = tas_series(np.full(365, 273.15, dtype=np.float32))
+        exp = generic.compare(ts, op, 273.15).resample(time="YS").sum()
+        out = generic.threshold_count(ts, op, 273.15, "YS")
+        np.testing.assert_array_equal(out, exp)
+
+    def test_empty_period(self, tas_series):
+        # No values in February
+        ts = tas_series(np.full(120, 260.0), start="2000-01-01")
+        ts = ts.isel(time=np.r_[0:31, 60:120])
+        exp = generic.compare(ts, "<", 273.15).resample(time="MS").sum()
+        out = generic.threshold_count(ts, "<", 273.15, "MS")
+        np.testing.assert_array_equal(out, [31, np.nan, 31, 30])
+        np.testing.assert_array_equal(out, exp)
+        assert out.dtype == np.float64
+
 
 class TestDomainCount:
     def test_simple(self, tas_series):
@@ -43,6 +76,15 @@ class TestDomainCount:
         out = generic.domain_count(ts, low=10, high=20, freq="Y")
         np.testing.assert_array_equal(out, [10, 0])
 
+    @pytest.mark.parametrize("chunks", [None, {"time": 100}])
+    def test_long_period(self, tas_series, chunks):
+        # More days within the domain than an int8 can hold
+        ts = tas_series(np.full(366, 15.0), start="2000-01-01")
+        if chunks:
+            ts = ts.chunk(chunks)
+        out = generic.domain_count(ts, low=10, high=20, freq="YS")
+        np.testing.assert_array_equal(out, [366])
+
 
 class TestFlowGeneric:
     def test_doyminmax(self, q_series):
@@ -278,6 +320,43 @@ class TestCumulativeDifference:
         np.testing.assert_allclose(out, expected)
         np.testing.assert_allclose(out, out_kelvin)
 
+    @pytest.mark.parametrize("op", [">", "<"])
+    @pytest.mark.parametrize("chunks", [None, {"time": -1}])
+    def test_freq(self, tas_series, op, chunks):
+        tas = tas_series(np.arange(400.0) % 30 + K2C, start="2000-01-01")
+        tas[[5, 300]] = np.nan
+        # No values in February
+        tas = tas.isel(time=np.r_[0:31, 60:400])
+        exp = generic.cumulative_difference(
+            tas.chunk(time=100), threshold="10 degC", op=op, freq="MS"
+        )
+        if chunks:
+            tas = tas.chunk(chunks)
+        out = generic.cumulative_difference(tas, threshold="10 degC", op=op, freq="MS")
+        np.testing.assert_allclose(out, exp)
+        assert np.isnan(out[1])
+        assert out.attrs["units"] == exp.attrs["units"]
+
+    @pytest.mark.parametrize("op", [">", "<"])
+    @pytest.mark.parametrize("chunks", [None, {"x": 1}])
+    def test_freq_array_threshold(self, tas_series, op, chunks):
+        tas = tas_series(np.arange(400.0) % 30 + K2C, start="2000-01-01")
+        tas = xr.concat([tas, tas + 5], "x")
+        thresh = xr.DataArray(
+            [[5.0, 10.0], [10.0, 15.0]],
+            dims=("x", "q"),
+            coords={"q": [0.1, 0.9]},
+            attrs={"units": "degC"},
+        )
+        exp = generic.cumulative_difference(
+            tas.chunk(time=100), threshold=thresh, op=op, freq="MS"
+        )
+        if chunks:
+            tas = tas.chunk(chunks)
+        out = generic.cumulative_difference(tas, threshold=thresh, op=op, freq="MS")
+        assert out.dims == exp.dims
+        np.testing.assert_allclose(out, exp)
+
     def test_forbidden(self, tas_series):
         tas = tas_series(np.array([-10, 15, 20, 3, 10]) + K2C)
 
@@ -513,6 +513,18 @@ def test_delayed(tasmax_series):
     assert isinstance(out.data, dask.array.Array)
 
 
+@pytest.mark.parametrize("rechunk_time", [True, False])
+def test_rechunk_time(tas_series, rechunk_time):
+    tas = tas_series(np.arange(720.0) % 30 + 250)
+    tas = xr.concat([tas, tas], dim="lat").chunk({"time": 100, "lat": 1})
+    with xclim.set_options(rechunk_time=rechunk_time):
+        out = atmos.growing_degree_days(tas, freq="MS")
+    assert isinstance(out.data, dask.array.Array)
+    assert len(out.chunks[out.get_axis_num("lat")]) == 2
+    assert (len(out.chunks[out.get_axis_num("time")]) == 1) is rechunk_time
+    np.testing.assert_allclose(out, atmos.growing_degree_days(tas.compute(), freq="MS"))
+
+
 def test_identifier():
     with pytest.warns(UserWarning):
         uniIndPr.__class__(identifier="t_{}")
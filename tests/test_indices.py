@@ -55,6 +55,23 @@ class TestMaxNDayPrecipitationAmount:
         assert len(rxnday) == 1
         assert rxnday.time.dt.year == 2000
 
+    # test dask-backed arrays, with chunks smaller than the window
+    def test_dask(self, pr_series):
+        a = pr_series(np.array([3, 4, 20, 20, 0, 6, 9, 25, 0, 0], dtype=float))
+        a[2] = np.nan
+        exp = xci.max_n_day_precipitation_amount(a, 3)
+        rxnday = xci.max_n_day_precipitation_amount(a.chunk(time=1), 3)
+        np.testing.assert_array_equal(rxnday, exp)
+        assert rxnday == 40 * 3600 * 24
+
+    # test windows crossing the period boundaries
+    def test_monthly(self, pr_series):
+        a = pr_series(np.random.rand(400) * 10, start="1999-12-01")
+        a[[20, 21, 150]] = np.nan
+        rxnday = xci.max_n_day_precipitation_amount(a, 5, freq="MS")
+        exp = (a * 3600 * 24).rolling(time=5).sum(skipna=False).resample(time="MS")
+        np.testing.assert_allclose(rxnday, exp.max())
+
 
 class TestMax1DayPrecipitationAmount:
     @staticmethod
@@ -654,6 +671,23 @@ class TestDailyFreezeThawCycles:
         np.testing.assert_array_equal(out[:2], [5, 1])
         np.testing.assert_array_equal(out[2:], 0)
 
+    @pytest.mark.parametrize("ops", [("<=", ">"), ("<", ">=")])
+    def test_fused(self, tasmin_series, tasmax_series, ops):
+        mn = np.random.randint(-3, 3, 365).astype(float)
+        mx = mn + np.random.randint(0, 3, 365)
+        mn[[5, 50]] = np.nan
+        mn = tasmin_series(mn + K2C)
+        mx = tasmax_series(mx + K2C)
+        kws = dict(op="sum", window=1, freq="MS", op_tasmin=ops[0], op_tasmax=ops[1])
+
+        out = xci.multiday_temperature_swing(mn, mx, **kws)
+        # Time split across chunks uses the run length algorithms
+        exp = xci.multiday_temperature_swing(
+            mn.chunk(time=50), mx.chunk(time=50), **kws
+        )
+        np.testing.assert_array_equal(out, exp)
+        assert out.dtype == exp.dtype
+
 
 class TestDailyPrIntensity:
     def test_simple(self, pr_series):
@@ -669,6 +703,21 @@ class TestDailyPrIntensity:
         out = xci.daily_pr_intensity(pr, thresh="1 mm/day")
         np.testing.assert_array_almost_equal(out[0], 2.5)
 
+    def test_shared_mask(self, pr_series):
+        pr = pr_series(np.zeros(365))
+        pr[3:8] += [0.5, 1, 2, 3, 4]
+        pr = pr.chunk(time=100)
+
+        def masks(da):
+            return {k for k in da.data.__dask_graph__().layers if k.startswith("ge-")}
+
+        out = xci.daily_pr_intensity(pr, thresh="1 kg/m**2/s")
+        wd = xci.wetdays(pr, thresh="1 kg/m**2/s")
+        # The wet days mask is computed once and shared with `wetdays`
+        assert len(masks(out)) == 1
+        assert masks(out) == masks(wd)
+        np.testing.assert_array_equal(out[0], 2.5 * 3600 * 24)
+
 
 class TestMaxPrIntensity:
     # Hourly indicator
@@ -682,6 +731,9 @@ class TestMaxPrIntensity:
         out = xci.max_pr_intensity(pr, window=12, freq="Y")
         np.testing.assert_array_almost_equal(out[0], 5.5)
 
+        out = xci.max_pr_intensity(pr.chunk(time=5), window=12, freq="Y")
+        np.testing.assert_array_almost_equal(out[0], 5.5)
+
         pr.attrs["units"] = "mm"
         with pytest.raises(ValidationError):
             xci.max_pr_intensity(pr, window=1, freq="Y")
@@ -809,6 +861,10 @@ class TestDaysOverPrecipThresh:
             out[0], (3 + 4 + 6 + 7) / (3 + 4 + 5 + 6 + 7)
         )
 
+        with set_options(precip_compare_dtype="float16"):
+            out = xci.days_over_precip_thresh(pr, per, thresh="2 kg/m**2/s")
+        np.testing.assert_array_almost_equal(out[0], 4)
+
     def test_quantile(self, pr_series):
         a = np.zeros(365)
         a[:8] = np.arange(8)
@@ -833,6 +889,25 @@ class TestDaysOverPrecipThresh:
         out = xci.days_over_precip_thresh(pr, per, thresh="0.5 kg/m**2/s")
         np.testing.assert_array_almost_equal(out, 300)
 
+    @pytest.mark.parametrize("chunks", [None, {"time": -1}])
+    def test_fraction_time_chunks(self, pr_series, per_doy, chunks):
+        a = np.arange(400.0) % 10
+        a[[3, 200]] = np.nan
+        pr = pr_series(a, start="1/1/2000")
+        # No values in February
+        pr = pr.isel(time=np.r_[0:31, 60:400])
+        per = per_doy(np.arange(366.0) % 7)
+
+        # Time split across chunks uses the broadcast thresholds
+        exp = xci.fraction_over_precip_thresh(
+            pr.chunk(time=100), per, thresh="1 kg/m**2/s", freq="MS"
+        )
+        if chunks:
+            pr = pr.chunk(chunks)
+        out = xci.fraction_over_precip_thresh(pr, per, thresh="1 kg/m**2/s", freq="MS")
+        np.testing.assert_allclose(out, exp)
+        assert np.isnan(out[1])
+
 
 class TestGrowingDegreeDays:
     def test_simple(self, tas_series):
@@ -1440,6 +1515,34 @@ class TestLiquidPrecipitationRatio:
         out = xci.liquid_precip_ratio(pr, tas=tas, freq="M")
         np.testing.assert_almost_equal(out[:1], [0.6])
 
+    def test_dask_time_chunks(self, pr_series, tas_series):
+        pr = np.zeros(100)
+        pr[10:20] = 1
+        pr[12] = np.nan
+        pr = pr_series(pr)
+
+        tas = np.zeros(100)
+        tas[:14] -= 20
+        tas[14:] += 10
+        tas = tas_series(tas + K2C)
+
+        exp = xci.liquid_precip_ratio(pr, tas=tas, freq="M")
+        np.testing.assert_almost_equal(exp[:1], [6 / 9])
+        out = xci.liquid_precip_ratio(
+            pr.chunk(time=10), tas=tas.chunk(time=10), freq="M"
+        )
+        np.testing.assert_array_equal(out, exp)
+        prsn = pr.where(tas <= K2C, 0)
+        out = xci.liquid_precip_ratio(pr, prsn=prsn, freq="M")
+        np.testing.assert_allclose(out, exp)
+
+    def test_float32(self, pr_series, tas_series):
+        # Temperatures are compared to the threshold in float32, as numpy does
+        pr = pr_series(np.ones(10, dtype=np.float32))
+        tas = tas_series(np.full(10, 273.16, dtype=np.float32))
+        out = xci.liquid_precip_ratio(pr, tas=tas, thresh="0.01 degC")
+        np.testing.assert_array_equal(out, [0])
+
 
 class TestMaximumConsecutiveDryDays:
     def test_simple(self, pr_series):
@@ -1535,6 +1638,48 @@ class TestPrecipAccumulation:
         np.testing.assert_array_equal(outsn2[0], 5 * 3600 * 24)
         np.testing.assert_array_equal(outrn[0], 5 * 3600 * 24)
 
+    @pytest.mark.parametrize("chunks", [{"time": -1}, {"time": 10}])
+    def test_dask_nan(self, pr_series, tas_series, chunks):
+        pr = np.zeros(100)
+        pr[5:20] = 1
+        pr[6] = np.nan
+        pr = pr_series(pr).chunk(chunks)
+
+        tas = np.ones(100) * 280
+        tas[5:10] = 270
+        tas[12] = np.nan
+        tas = tas_series(tas).chunk(chunks)
+
+        out = xci.precip_accumulation(pr, freq="MS")
+        outsn = xci.precip_accumulation(pr, tas=tas, phase="solid", freq="MS")
+        outrn = xci.precip_accumulation(pr, tas=tas, phase="liquid", freq="MS")
+
+        np.testing.assert_allclose(out[0], 14 * 3600 * 24)
+        np.testing.assert_allclose(outsn[0], 4 * 3600 * 24)
+        # Days with a missing temperature are counted as liquid
+        np.testing.assert_allclose(outrn[0], 10 * 3600 * 24)
+
+    def test_float32(self, pr_series, tas_series):
+        # Temperatures are compared to the threshold in float32, as numpy does
+        pr = pr_series(np.ones(10, dtype=np.float32))
+        tas = tas_series(np.full(10, 273.16, dtype=np.float32))
+        exp = xci.precip_accumulation(
+            pr.chunk(time=5), tas=tas, phase="solid", thresh="0.01 degC"
+        )
+        out = xci.precip_accumulation(pr, tas=tas, phase="solid", thresh="0.01 degC")
+        np.testing.assert_array_equal(out, exp)
+        np.testing.assert_allclose(out, 10 * 3600 * 24)
+
+    def test_empty_period(self, pr_series):
+        # No values in February
+        pr = pr_series(np.ones(120), start="2000-01-01")
+        pr = pr.isel(time=np.r_[0:31, 60:120])
+
+        out = xci.precip_accumulation(pr, freq="MS")
+        exp = xci.precip_accumulation(pr.chunk(time=10), freq="MS")
+        np.testing.assert_array_equal(out, exp)
+        assert np.isnan(out[1])
+
 
 class TestPrecipAverage:
     # build test data for different calendar
@@ -1627,6 +1772,23 @@ class TestRainOnFrozenGround:
         out = xci.rain_on_frozen_ground_days(pr, tas, freq="MS")
         assert out[0] == 1
 
+    @pytest.mark.parametrize("chunks", [{"time": -1}, {"time": 10}])
+    def test_across_periods(self, tas_series, pr_series, chunks):
+        tas = np.zeros(60) - 1
+        pr = np.zeros(60)
+
+        # Frozen days at the end of January, rain on the first of February
+        tas[[5, 31, 40, 50]] += 5
+        pr[[5, 31, 40, 50]] += 5
+        # A missing temperature is not above freezing
+        tas[45] = np.nan
+
+        tas = tas_series(tas + K2C).chunk(chunks)
+        pr = pr_series(pr).chunk(chunks)
+
+        out = xci.rain_on_frozen_ground_days(pr, tas, freq="MS")
+        np.testing.assert_array_equal(out, [0, 3])
+
 
 class TestTGXN10p:
     def test_tg10p_simple(self, tas_series):
@@ -1721,6 +1883,32 @@ class TestTGXN90p:
         assert out[1] == 29
         assert out[5] == 25
 
+    def test_tg90p_dask_nan(self, tas_series):
+        rng = np.random.default_rng(0)
+        tas = tas_series(rng.normal(280, 5, 365 * 3), start="1/1/2000")
+        tas[10] = np.nan
+        # Percentiles missing the 366th day of year
+        t90 = percentile_doy(tas, per=90).sel(percentiles=90, dayofyear=slice(1, 365))
+
+        out = xci.tg90p(tas, t90, freq="MS")
+        # Inputs split along time are compared to the thresholds broadcast along time
+        exp = xci.tg90p(tas.chunk(time=100), t90, freq="MS")
+        np.testing.assert_array_equal(out, exp)
+        assert out.sum() > 0
+
+    def test_tg90p_empty_period(self, tas_series):
+        rng = np.random.default_rng(0)
+        tas = tas_series(rng.normal(280, 5, 365 * 3), start="1/1/2000")
+        t90 = percentile_doy(tas, per=90).sel(percentiles=90)
+        # No values in February 2000
+        tas = tas.isel(time=np.r_[0:31, 60 : 365 * 3])
+
+        out = xci.tg90p(tas, t90, freq="MS")
+        exp = xci.tg90p(tas.chunk(time=100), t90, freq="MS")
+        np.testing.assert_array_equal(out, exp)
+        assert np.isnan(out[1])
+        assert out.dtype == np.float64
+
 
 class TestTas:
     @pytest.mark.parametrize("tasmin_units", ["K", "°C"])
@@ -1828,6 +2016,29 @@ class TestTgMaxTgMinIndices:
 
         np.testing.assert_equal(dtr, output)
 
+    @pytest.mark.parametrize("op", ["max", "min", "mean", "sum"])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_fused_daily_temperature_range(
+        self, tasmin_series, tasmax_series, op, dtype
+    ):
+        tasmin, tasmax = self.random_tmin_tmax_setup(400, tasmin_series, tasmax_series)
+        tasmin = tasmin.astype(dtype)
+        tasmax = tasmax.astype(dtype)
+        # A month with only NaNs and a month without values
+        tasmin[31:62] = np.nan
+        tasmin = tasmin.isel(time=np.r_[0:92, 123:400])
+        tasmax = tasmax.isel(time=np.r_[0:92, 123:400])
+
+        dtr = xci.daily_temperature_range(tasmin, tasmax, freq="MS", op=op)
+        # Time split across chunks uses the xarray reductions
+        exp = xci.daily_temperature_range(
+            tasmin.chunk(time=100), tasmax.chunk(time=100), freq="MS", op=op
+        )
+        np.testing.assert_allclose(dtr, exp, rtol=1e-6)
+        assert dtr.dtype == exp.dtype
+        assert dtr.units == "K"
+        assert np.isnan(dtr[3])
+
     # def test_random_variable_daily_temperature_range(self, tasmin_series, tasmax_series):
     #     days = 1095
     #     tasmin, tasmax = self.random_tmin_tmax_setup(days, tasmin_series, tasmax_series)
@@ -2374,6 +2585,13 @@ class TestWindConversion:
             == np.around(self.da_windfromdir.values, decimals=10)
         )
 
+        # Calm winds have a direction of 0
+        wind, windfromdir = xci.uas_vas_2_sfcwind(
+            self.da_uas.chunk(), self.da_vas.chunk(), calm_wind_thresh="1.5 m/s"
+        )
+        assert windfromdir.chunks is not None
+        np.testing.assert_array_equal(windfromdir.isel(lon=1), [0, 360])
+
     def test_sfcwind_2_uas_vas(self):
         uas, vas = xci.sfcwind_2_uas_vas(self.da_wind, self.da_windfromdir)
 
@@ -2383,6 +2601,14 @@ class TestWindConversion:
             == np.around(np.array([[1, 1], [-(np.hypot(1, 1)) / 3.6, -5]]), decimals=10)
         )
 
+        uasd, vasd = xci.sfcwind_2_uas_vas(
+            self.da_wind.chunk(), self.da_windfromdir.chunk()
+        )
+        assert uasd.chunks is not None
+        assert uasd.attrs["units"] == vasd.attrs["units"] == "m s-1"
+        np.testing.assert_allclose(uasd, uas)
+        np.testing.assert_allclose(vasd, vas)
+
 
 @pytest.mark.parametrize(
     "method", ["bohren98", "tetens30", "sonntag90", "goffgratch46", "wmo08"]
@@ -2441,6 +2667,56 @@ def test_saturation_vapor_pressure(tas_series, method, ice_thresh, exp0, units):
     np.testing.assert_allclose(e_sat, e_sat_exp, atol=0.5, rtol=0.005)
 
 
+@pytest.mark.parametrize(
+    "method", ["tetens30", "sonntag90", "goffgratch46", "wmo08", "its90"]
+)
+def test_saturation_vapor_pressure_dtype(tas_series, method):
+    tas = tas_series(np.array([-20, -1, np.nan, 10, 30], dtype=np.float32) + K2C)
+    tas = tas.astype(np.float32)
+    exp = xci.saturation_vapor_pressure(tas=tas.astype(np.float64), method=method)
+
+    e_sat = xci.saturation_vapor_pressure(tas=tas, method=method)
+    assert e_sat.dtype == np.float32
+    assert e_sat.attrs["units"] == "Pa"
+    np.testing.assert_allclose(e_sat, exp, rtol=1e-6)
+
+    e_sat = xci.saturation_vapor_pressure(tas=tas.chunk(), method=method)
+    assert e_sat.chunks is not None
+    np.testing.assert_allclose(e_sat, exp, rtol=1e-6)
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_humidity_wind_float32(
+    tas_series, hurs_series, huss_series, ps_series, sfcWind_series, use_dask
+):
+    def f32(da):
+        da = da.astype(np.float32)
+        return da.chunk() if use_dask else da
+
+    tas = f32(tas_series(np.array([-10, 10, 20, 35]) + K2C))
+    hurs = f32(hurs_series([10, 90, 20, 80]))
+    huss = f32(huss_series([1e-4, 6e-3, 3e-3, 2e-2]))
+    ps = f32(ps_series([100000, 100000, 101000, 101000]))
+    wind = f32(sfcWind_series([0.2, 2, 6, 10]))
+    winddir = wind.copy(data=np.array([0, 90, 180, 270], dtype=np.float32))
+    winddir.attrs["units"] = "degree"
+
+    outs = [
+        xci.saturation_vapor_pressure(tas=tas),
+        xci.relative_humidity(tas=tas, huss=huss, ps=ps),
+        xci.specific_humidity(tas=tas, hurs=hurs, ps=ps, invalid_values="mask"),
+        xci.wind_chill_index(tas=tas, sfcWind=wind, mask_invalid=False),
+        *xci.uas_vas_2_sfcwind(wind, wind),
+        *xci.sfcwind_2_uas_vas(wind, winddir),
+    ]
+    for out in outs:
+        assert out.dtype == np.float32
+        # Lazy with dask inputs
+        assert (out.chunks is not None) == use_dask
+        # The dask metadata matches the computed values
+        assert out.compute().dtype == np.float32
+
+
 @pytest.mark.parametrize("method", ["tetens30", "sonntag90", "goffgratch46", "wmo08"])
 @pytest.mark.parametrize(
     "invalid_values,exp0", [("clip", 100), ("mask", np.nan), (None, 188)]
@@ -2542,6 +2818,19 @@ def test_rain_approximation(pr_series, tas_series, method, exp):
     np.testing.assert_allclose(prlp, exp, atol=1e-5, rtol=1e-3)
 
 
+def test_binary_precip_phase_nan(pr_series, tas_series):
+    pr = pr_series(np.array([np.nan, 1, np.nan, 1], dtype=np.float32))
+    tas = tas_series(np.array([-5, np.nan, 5, 5]) + K2C).chunk()
+
+    prsn = xci.snowfall_approximation(pr, tas=tas, method="binary")
+    prlp = xci.rain_approximation(pr, tas=tas, method="binary")
+    assert prsn.dtype == prlp.dtype == np.float32
+    assert prlp.attrs["units"] == pr.attrs["units"]
+    # Same as the sum of the phases, with NaN where pr is NaN
+    np.testing.assert_array_equal(prlp, pr - prsn)
+    np.testing.assert_array_equal(prsn, [np.nan, 0, 0, 0])
+
+
 def test_first_snowfall(prsn_series, prsnd_series):
     # test with prsnd [mm day-1]
     prsnd = prsnd_series(
@@ -2766,6 +3055,26 @@ def test_high_precip_low_temp(pr_series, tasmin_series):
     out = xci.high_precip_low_temp(pr, tas, pr_thresh="1 kg m-2 s-1", tas_thresh="1 C")
     np.testing.assert_array_equal(out, [1])
 
+    # Values are compared to the thresholds in float32, as numpy does
+    tas = tasmin_series(np.array([0, 0, 1, 1], dtype=np.float32) + np.float32(K2C))
+    pr = pr_series(np.ones(4, dtype=np.float32))
+    out = xci.high_precip_low_temp(pr, tas, pr_thresh="1 kg m-2 s-1", tas_thresh="0 C")
+    np.testing.assert_array_equal(out, [0])
+
+
+def test_fused_counts_empty_period(pr_series, tas_series):
+    # No values in February
+    pr = pr_series(np.ones(120), start="2000-01-01").isel(time=np.r_[0:31, 60:120])
+    tas = tas_series(np.full(120, 260.0), start="2000-01-01").isel(
+        time=np.r_[0:31, 60:120]
+    )
+    for func in [xci.high_precip_low_temp, xci.rain_on_frozen_ground_days]:
+        out = func(pr, tas, freq="MS")
+        # Not fused when time is split across chunks
+        exp = func(pr.chunk(time=10), tas.chunk(time=10), freq="MS")
+        np.testing.assert_array_equal(out, exp)
+        assert np.isnan(out[1])
+
 
 def test_blowing_snow(snd_series, sfcWind_series):
     snd = snd_series([0, 0.1, 0.2, 0, 0, 0.1, 0.3, 0.5, 0.7, 0])
@@ -2872,6 +3181,14 @@ def test_wind_chill(tas_series, sfcWind_series):
     out = xci.wind_chill_index(tas=tas, sfcWind=sfcWind, method="US")
     assert out[-1].isnull()
 
+    out = xci.wind_chill_index(
+        tas=tas.chunk(), sfcWind=sfcWind.chunk(), mask_invalid=False
+    )
+    assert out.chunks is not None
+    assert out.attrs["units"] == "degC"
+    # Not masked, even if the temperature is above 0°C
+    np.testing.assert_allclose(out[3], 7.227968759727892)
+
 
 class TestClausiusClapeyronScaledPrecip:
     def test_simple(self):
@@ -55,6 +55,16 @@ class TestMissingAnyFills:
         miss = missing.missing_any(da, "YS")
         np.testing.assert_array_equal(miss, [True, False, True])
 
+    @pytest.mark.parametrize("use_flox", [True, False])
+    def test_missing_days_2d(self, tas_series, use_flox):
+        a = np.arange(360.0)
+        a[5:10] = np.nan
+        ts = xr.concat([tas_series(a), tas_series(a[::-1])], "x").chunk(x=1)
+        with xr.set_options(use_flox=use_flox):
+            out = missing.missing_any(ts, freq="MS")
+        assert out.dims == ("x", "time")
+        np.testing.assert_array_equal(out[:, [0, 1, -1]], [[1, 0, 1], [0, 0, 1]])
+
     def test_missing_season(self):
         n = 378
         times = pd.date_range("2001-12-31", freq="1D", periods=n)
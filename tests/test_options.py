@@ -22,6 +22,8 @@ from xclim.core.options import OPTIONS, register_missing_method
         ("missing_options", {"wmo": {"nm": 10, "nc": 3}}),
         ("missing_options", {"pct": {"tolerance": 0.1}}),
         ("missing_options", {"wmo": {"nm": 10, "nc": 3}, "pct": {"tolerance": 0.1}}),
+        ("precip_compare_dtype", "float16"),
+        ("rechunk_time", True),
     ],
 )
 def test_set_options_valid(option, value):
@@ -54,6 +56,8 @@ def test_set_options_valid(option, value):
             "missing_options",
             {"wmo": {"nm": 45, "nc": 3, "_validator": lambda x: x < 1}},
         ),
+        ("precip_compare_dtype", "int8"),
+        ("rechunk_time", "auto"),
     ],
 )
 def test_set_options_invalid(option, value):
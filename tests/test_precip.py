@@ -274,6 +274,21 @@ class TestWetDays:
         assert np.isnan(out1.values[0, -1, -1])
         # assert (np.isnan(wds.values[0, -1, -1]))
 
+    @pytest.mark.parametrize("check_missing", ["any", "skip"])
+    def test_null_cells(self, pr_ndseries, check_missing):
+        a = np.random.default_rng(0).gamma(0.5, 3, (365, 4, 5))
+        # Cells outside of a clipped region, and a cell with a single missing value
+        a[:, 2:, :] = np.nan
+        a[100, 0, 0] = np.nan
+        pr = pr_ndseries(a, units="mm/d")
+
+        with set_options(check_missing=check_missing):
+            out = atmos.wetdays(pr, freq="MS", month=[1, 2, 3])
+            # Dask-backed inputs are computed on all cells
+            exp = atmos.wetdays(pr.chunk(), freq="MS", month=[1, 2, 3])
+        xr.testing.assert_equal(out, exp)
+        assert out.attrs.keys() == exp.attrs.keys()
+
 
 class TestWetPrcptot:
     """Testing of prcptot with wet days"""
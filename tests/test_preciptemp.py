@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from xclim import atmos
+from xclim import indices as xci
 from xclim.core.calendar import percentile_doy
 
 K2C = 273
@@ -74,3 +75,34 @@ class TestColdAndWet:
         result = atmos.cold_and_wet_days(ts, pr, ts_per, pr_per, freq="MS")
         # THEN january has 10 cold and wet days
         assert result.data[0] == 10
+
+    def test_dask_time_chunks(self, tas_series, pr_series):
+        # The fused computation and the one used when time is split across chunks give the same result
+        rng = np.random.default_rng(0)
+        ts = tas_series(rng.normal(K2C + 10, 5, 365 * 4))
+        ts[100] = np.nan
+        pr = pr_series(rng.gamma(0.5, 3, 365 * 4))
+        ts_per = percentile_doy(ts, 5, 25).sel(percentiles=25)
+        pr_per = percentile_doy(pr, 5, 75).sel(percentiles=75)
+        exp = atmos.cold_and_wet_days(ts, pr, ts_per, pr_per, freq="MS")
+        out = atmos.cold_and_wet_days(
+            ts.chunk(time=365), pr.chunk(time=365), ts_per, pr_per, freq="MS"
+        )
+        np.testing.assert_array_equal(out, exp)
+        assert exp.sum() > 0
+
+    def test_empty_period(self, tas_series, pr_series):
+        rng = np.random.default_rng(0)
+        ts = tas_series(rng.normal(K2C + 10, 5, 365 * 4), start="2000-01-01")
+        pr = pr_series(rng.gamma(0.5, 3, 365 * 4), start="2000-01-01")
+        ts_per = percentile_doy(ts, 5, 25).sel(percentiles=25)
+        pr_per = percentile_doy(pr, 5, 75).sel(percentiles=75)
+        # No values in February 2000
+        sel = np.r_[0:31, 60 : 365 * 4]
+        ts, pr = ts.isel(time=sel), pr.isel(time=sel)
+        exp = xci.cold_and_wet_days(
+            ts.chunk(time=365), pr.chunk(time=365), ts_per, pr_per, freq="MS"
+        )
+        out = xci.cold_and_wet_days(ts, pr, ts_per, pr_per, freq="MS")
+        np.testing.assert_array_equal(out, exp)
+        assert np.isnan(out[1])
@@ -141,6 +141,118 @@ def test_extract_events_identity(use_dask, index):
     np.testing.assert_array_equal(events, expected)
 
 
+@pytest.mark.parametrize("chunks", [None, {"time": 100}, {"x": 1}])
+@pytest.mark.parametrize("freq", ["MS", "QS-DEC", "YS"])
+def test_resample_and_rl_longest_run(chunks, freq):
+    time = pd.date_range("2000-01-01", periods=800, freq="D")
+    values = np.random.default_rng(0).random((3, 800)) > 0.3
+    # A run crossing the end of March 2000 and of year 2000
+    values[:, 80:100] = True
+    values[:, 360:370] = True
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    exp = da.resample(time=freq).map(rl.longest_run, dim="time")
+    if chunks:
+        da = da.chunk(chunks)
+
+    out = rl.resample_and_rl(da, True, rl.longest_run, freq=freq)
+    np.testing.assert_array_equal(out.transpose(*exp.dims), exp)
+
+
+def test_resample_and_rl_longest_run_empty_period():
+    time = pd.date_range("2000-01-01", periods=400, freq="D")
+    values = np.random.default_rng(0).random((3, 400)) > 0.3
+    # No values in February
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    da = da.isel(time=np.r_[0:31, 60:400])
+
+    out = rl.resample_and_rl(da, True, rl.longest_run, freq="MS")
+    # Time split across chunks uses the vectorized algorithm
+    exp = rl.resample_and_rl(da.chunk(time=100), True, rl.longest_run, freq="MS")
+    xr.testing.assert_identical(out, exp)
+    assert np.isnan(out[:, 1]).all()
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+@pytest.mark.parametrize("freq", ["MS", "YS"])
+def test_resample_and_rl_window_1(use_dask, freq):
+    time = pd.date_range("2000-01-01", periods=800, freq="D")
+    values = np.random.default_rng(0).random((3, 800)) > 0.3
+    values[:, 80:100] = True
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    for func in [rl.windowed_run_events, rl.windowed_run_count]:
+        exp = da.resample(time=freq).map(func, window=1, dim="time")
+        inp = da.chunk({"time": 100}) if use_dask else da
+        out = rl.resample_and_rl(inp, True, func, window=1, freq=freq)
+        np.testing.assert_array_equal(out.transpose(*exp.dims), exp)
+        assert out.dtype == exp.dtype
+
+
+def test_resample_and_rl_window_1_empty_period():
+    time = pd.date_range("2000-01-01", periods=400, freq="D")
+    values = np.random.default_rng(0).random((3, 400)) > 0.3
+    # No values in February
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    da = da.isel(time=np.r_[0:31, 60:400])
+    for func in [rl.windowed_run_events, rl.windowed_run_count]:
+        exp = da.resample(time="MS").map(func, window=1, dim="time")
+        out = rl.resample_and_rl(da, True, func, window=1, freq="MS")
+        np.testing.assert_array_equal(out.transpose(*exp.dims), exp)
+        assert out.dtype == exp.dtype
+
+
+@pytest.mark.parametrize("chunks", [None, {"x": 1}, {"time": -1}])
+def test_resample_and_rl_windowed(chunks):
+    time = pd.date_range("2000-01-01", periods=800, freq="D")
+    values = np.random.default_rng(0).random((3, 800)) > 0.3
+    values[:, 80:100] = True
+    # No values in February of 2000
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    da = da.isel(time=np.r_[0:31, 60:800])
+    inp = da if chunks is None else da.chunk(chunks)
+    for func in [rl.windowed_run_events, rl.windowed_run_count]:
+        exp = da.resample(time="MS").map(func, window=3, dim="time")
+        out = rl.resample_and_rl(inp, True, func, window=3, freq="MS")
+        np.testing.assert_array_equal(out.transpose(*exp.dims), exp)
+        assert np.isnan(out[:, 1]).all()
+
+
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_run_kernels(use_dask):
+    values = np.random.default_rng(0).random((3, 400)) > 0.3
+    values[:, -10:] = True
+    da = xr.DataArray(values, dims=("x", "time"))
+    inp = da.chunk({"x": 1}) if use_dask else da
+    for func, func_1d in [
+        (rl.windowed_run_events, rl.windowed_run_events_1d),
+        (rl.windowed_run_count, rl.windowed_run_count_1d),
+    ]:
+        exp = [func_1d(values[i], window=3) for i in range(3)]
+        for ufunc_1dim in [True, False]:
+            out = func(inp, window=3, ufunc_1dim=ufunc_1dim)
+            np.testing.assert_array_equal(out, exp)
+
+    exp = [rl.statistics_run_1d(values[i], reducer="max", window=1) for i in range(3)]
+    out = rl.longest_run(inp, ufunc_1dim=False)
+    np.testing.assert_array_equal(out, exp)
+
+
+@pytest.mark.parametrize("chunks", [None, {"x": 1}, {"time": 100}])
+@pytest.mark.parametrize("coord", [False, True, "dayofyear"])
+def test_boundary_run_freq_window_1(chunks, coord):
+    time = pd.date_range("2000-01-01", periods=800, freq="D")
+    values = np.random.default_rng(0).random((3, 800)) > 0.95
+    # A period with only True values and one with only False values
+    values[0, :31] = True
+    values[1, 100:200] = False
+    da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+    inp = da.chunk(chunks) if chunks else da
+    for func in [rl.first_run, rl.last_run]:
+        exp = da.resample(time="MS").map(func, window=1, dim="time", coord=coord)
+        out = func(inp, window=1, dim="time", freq="MS", coord=coord)
+        xr.testing.assert_identical(out, exp)
+        assert np.isnan(out[0, 0])
+
+
 def test_extract_events():
     values = np.zeros(365)
     time = pd.date_range("2000-01-01", periods=365, freq="D")
@@ -495,6 +607,25 @@ class TestRunsWithDates:
         )
         np.testing.assert_array_equal(np.mean(out.load()), expected)
 
+    @pytest.mark.parametrize("date", ["07-01", "01-01", None])
+    @pytest.mark.parametrize("chunks", [None, {"x": 1}])
+    def test_season_length_freq(self, date, chunks):
+        time = pd.date_range("2000-01-01", periods=1000, freq="D")
+        values = np.random.default_rng(0).random((4, 1000)) > 0.4
+        values[0] = True
+        values[1] = False
+        # No values in February 2001
+        da = xr.DataArray(values, coords={"time": time}, dims=("x", "time"))
+        da = da.isel(time=np.r_[0:397, 425:1000])
+        exp = da.resample(time="QS-DEC").map(
+            rl.season_length, window=3, date=date, dim="time"
+        )
+        if chunks:
+            da = da.chunk(chunks)
+
+        out = rl.season_length(da, window=3, date=date, dim="time", freq="QS-DEC")
+        xr.testing.assert_identical(out, exp)
+
     @pytest.mark.parametrize(
         "coord,date,end,expected",
         [
@@ -135,6 +135,27 @@ class TestFit:
         assert p.attrs["estimator"] == "Maximum likelihood"
 
 
+@pytest.mark.parametrize("dist", ["gamma", "fisk"])
+def test_fit_app(fitda, dist):
+    da = fitda.where((fitda.x > 0) | (fitda.y > 0) | (fitda.time > fitda.time[45]))
+    da[:10, 1, 1] = 0
+    p = stats.fit(da, dist, method="APP")
+    assert p.attrs["estimator"] == "Approximative method"
+    for x, y in [(0, 0), (1, 1)]:
+        exp = stats._fitfunc_1d(
+            da.values[:, x, y], dist=stats.get_dist(dist), nparams=3, method="APP"
+        )
+        np.testing.assert_allclose(p[:, x, y], exp)
+    assert np.isnan(stats.fit(da[:46], dist, method="APP")[:, 0, 0]).all()
+
+
+def test_dist_method(fitda):
+    p = stats.fit(fitda, "lognorm")
+    out = stats.dist_method("cdf", p, fitda)
+    exp = lognorm.cdf(fitda.values[:, 0, 1], *p.values[:, 0, 1])
+    np.testing.assert_array_equal(out.isel(x=0, y=1), exp)
+
+
 def test_weibull_min_fit(weibull_min):
     """Check ML fit with a series that leads to poor values without good initial conditions."""
     p = stats.fit(weibull_min, "weibull_min")
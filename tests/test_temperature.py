@@ -354,6 +354,26 @@ class TestConsecutiveFrostDays:
         out = atmos.consecutive_frost_days(ts)
         np.testing.assert_array_equal(out, [np.nan])
 
+    @pytest.mark.parametrize("check_missing", ["any", "skip"])
+    def test_null_cells(self, pr_ndseries, check_missing):
+        a = K2C + np.random.default_rng(0).normal(0, 5, (366, 4, 5))
+        # Cells outside of a clipped region, and a cell with a single missing value
+        a[:, 2:, :] = np.nan
+        a[100, 0, 0] = np.nan
+        ts = pr_ndseries(a, units="K").rename("tasmin")
+        ts.attrs.update(standard_name="air_temperature", cell_methods="")
+        per = percentile_doy(ts, per=10).sel(percentiles=10)
+
+        with set_options(check_missing=check_missing):
+            out = atmos.consecutive_frost_days(ts, freq="MS")
+            # Dask-backed inputs are computed on all cells
+            exp = atmos.consecutive_frost_days(ts.chunk(), freq="MS")
+            xr.testing.assert_equal(out, exp)
+
+            out = atmos.tn10p(ts, per, freq="MS")
+            exp = atmos.tn10p(ts.chunk(), per, freq="MS")
+            xr.testing.assert_equal(out, exp)
+
 
 class TestConsecutiveFrostFreeDays:
     def test_real_data(self, atmosds):
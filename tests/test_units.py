@@ -10,6 +10,7 @@ from dask import array as dsk
 
 from xclim import indices, set_options
 from xclim.core.units import (
+    _convert_str_units,
     amount2lwethickness,
     amount2rate,
     check_units,
@@ -105,6 +106,26 @@ class TestConvertUnitsTo:
         out = convert_units_to("10 degC days", "K days")
         assert out == 10
 
+    def test_same_units(self, tas_series):
+        tas = tas_series(np.arange(5.0), units="degK")
+        out = convert_units_to(tas, "degK")
+        assert out is tas
+        assert out.attrs["units"] == "K"
+
+        out = convert_units_to(tas_series(np.arange(5.0), units="degC"), tas)
+        assert out.attrs["units"] == "K"
+        np.testing.assert_allclose(out, np.arange(5.0) + 273.15)
+
+    def test_str_cached(self):
+        assert convert_units_to("0 degC", "K") == 273.15
+        assert convert_units_to("0 degC", units.K) == 273.15
+        with pytest.raises(pint.errors.DimensionalityError):
+            convert_units_to("0 degC", "m")
+        # The converted string thresholds are not re-parsed
+        hits = _convert_str_units.cache_info().hits
+        assert convert_units_to("0 degC", "K") == 273.15
+        assert _convert_str_units.cache_info().hits == hits + 1
+
     def test_cf_conversion_amount2lwethickness_error(self):
         # It is not thickness data because the standard name is wrong (absent)
         not_thickness_data = xr.DataArray([1, 2, 3], attrs={"units": "mm"})
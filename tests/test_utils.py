@@ -5,9 +5,12 @@ from __future__ import annotations
 from inspect import signature
 
 import numpy as np
+import pandas as pd
 import xarray as xr
 
 from xclim.core.utils import (
+    _period_counts,
+    _time_component,
     ensure_chunk_size,
     nan_calc_percentiles,
     walk_map,
@@ -61,6 +64,39 @@ def test_ensure_chunk_size():
     assert out.chunks[2] == (20,)
 
 
+def test_period_counts():
+    time = pd.date_range("2000-01-01", periods=400, freq="D")
+    da = xr.DataArray(
+        np.zeros((400, 2)),
+        dims=("time", "lat"),
+        coords={"time": time, "lat": [10.0, 20.0]},
+    )
+    da = da.isel(time=np.r_[0:31, 60:400])
+
+    exp = da.time.resample(time="MS").count()
+    out = _period_counts(da, "MS")
+    np.testing.assert_array_equal(out, exp)
+    np.testing.assert_array_equal(out.time, exp.time)
+
+    # Cached for the time index, without the scalar coordinates of the array
+    sub = da.isel(lat=1)
+    out = _period_counts(sub, "MS")
+    assert sub.indexes["time"] is da.indexes["time"]
+    assert "lat" not in out.coords
+    np.testing.assert_array_equal(out, exp)
+
+
+def test_time_component():
+    time = xr.cftime_range("2000-01-01", periods=400, freq="D", calendar="noleap")
+    da = xr.DataArray(np.zeros((400, 2)), dims=("time", "lat"), coords={"time": time})
+
+    out = _time_component(da, "dayofyear")
+    np.testing.assert_array_equal(out, da.time.dt.dayofyear)
+    assert not out.flags.writeable
+    # Cached for the time index
+    assert _time_component(da.isel(lat=0), "dayofyear") is out
+
+
 class TestNanCalcPercentiles:
     def test_calc_perc_type7(self):
         # Exemple array from: https://en.wikipedia.org/wiki/Percentile#The_nearest-rank_method
@@ -110,3 +146,11 @@ class TestNanCalcPercentiles:
         # The expected is from R `quantile(arr, 0.5, type=8, na.rm = TRUE)`
         # Note that scipy mquantiles would give a different result here
         assert res[()] == 42.0
+
+    def test_calc_perc_multiple(self):
+        arr = np.random.default_rng(0).random((3, 50))
+        arr[1, :10] = np.NaN
+        arr[2, ::2] = np.NaN
+        res = nan_calc_percentiles(arr, percentiles=[0.0, 10.0, 50.0, 90.0, 100.0])
+        exp = np.nanpercentile(arr, [0.0, 10.0, 50.0, 90.0, 100.0], axis=-1)
+        np.testing.assert_allclose(res, exp)
@@ -376,7 +376,9 @@ class XclimCli(click.MultiCommand):
 @click.option(
     "--chunks",
     help="Chunks to use when opening the input dataset(s). "
-    "Given as <dim1>:num,<dim2:num>. Ex: time:365,lat:168,lon:150.",
+    "Given as <dim1>:num,<dim2:num>. Ex: time:365,lat:168,lon:150. "
+    "A size of -1 puts the dimension in a single chunk and 'auto' sizes the chunks following dask's "
+    "'array.chunk-size' configuration. Ex: time:-1,lat:auto,lon:auto.",
 )
 @click.pass_context
 def cli(ctx, **kwargs):
@@ -424,7 +426,7 @@ def cli(ctx, **kwargs):
         )
     if kwargs["chunks"] is not None:
         kwargs["chunks"] = {
-            dim: int(num)
+            dim: num if num == "auto" else int(num)
             for dim, num in map(lambda x: x.split(":"), kwargs["chunks"].split(","))
         }
 
@@ -13,6 +13,7 @@ import cftime
 import numpy as np
 import pandas as pd
 import xarray as xr
+from dask import array as dsk
 from xarray.coding.cftime_offsets import (
     MonthBegin,
     MonthEnd,
@@ -26,7 +27,7 @@ from xarray.coding.cftime_offsets import (
 from xarray.coding.cftimeindex import CFTimeIndex
 from xarray.core.resample import DataArrayResample, DatasetResample
 
-from xclim.core.utils import DayOfYearStr, uses_dask
+from xclim.core.utils import DayOfYearStr, _time_component, uses_dask
 
 from .formatting import update_xclim_history
 
@@ -573,7 +574,7 @@ def percentile_doy(
     rr = arr.rolling(min_periods=1, center=True, time=window).construct("window")
 
     ind = pd.MultiIndex.from_arrays(
-        (rr.time.dt.year.values, rr.time.dt.dayofyear.values),
+        (_time_component(arr, "year"), _time_component(arr, "dayofyear")),
         names=("year", "dayofyear"),
     )
     rrr = rr.assign_coords(time=ind).unstack("time").stack(stack_dim=("year", "window"))
@@ -800,8 +801,9 @@ def adjust_doy_calendar(
       Interpolated source array over coordinates spanning the target `dayofyear` range.
 
     """
-    max_target_doy = int(target.time.dt.dayofyear.max())
-    min_target_doy = int(target.time.dt.dayofyear.min())
+    target_doy = _time_component(target, "dayofyear")
+    max_target_doy = int(target_doy.max())
+    min_target_doy = int(target_doy.min())
 
     def has_same_calendar():
         # case of full year (doys between 1 and 360|365|366)
@@ -842,7 +844,28 @@ def resample_doy(doy: xr.DataArray, arr: xr.DataArray | xr.Dataset) -> xr.DataAr
     # Adjust calendar
     adoy = adjust_doy_calendar(doy, arr)
 
-    out = adoy.rename(dayofyear="time").reindex(time=arr.time.dt.dayofyear)
+    # Position of the day of year of each time step, -1 where it is missing from `adoy`
+    idx = adoy.indexes["dayofyear"].get_indexer(_time_component(arr, "dayofyear"))
+    time_chunks = arr.chunksizes.get("time") if uses_dask(arr) else None
+
+    if (idx == -1).any():
+        out = adoy.rename(dayofyear="time").reindex(time=arr.time.dt.dayofyear)
+    elif time_chunks is not None:
+        # Gather the values block by block, so the output has the same chunks as `arr` along `time`
+        # instead of a single chunk spanning the whole time series.
+        adoy = adoy.chunk({"dayofyear": -1})
+        axis = adoy.get_axis_num("dayofyear")
+        bounds = np.cumsum((0,) + tuple(time_chunks))
+        data = dsk.concatenate(
+            [
+                dsk.take(adoy.data, idx[start:end], axis=axis)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ],
+            axis=axis,
+        )
+        out = adoy.isel(dayofyear=idx).copy(data=data).rename(dayofyear="time")
+    else:
+        out = adoy.isel(dayofyear=idx).rename(dayofyear="time")
     out["time"] = arr.time
 
     return out
@@ -10,6 +10,7 @@ import re
 import string
 from ast import literal_eval
 from fnmatch import fnmatch
+from functools import lru_cache
 from inspect import _empty, signature  # noqa
 from typing import Any, Sequence
 
@@ -33,6 +34,10 @@ DEFAULT_FORMAT_PARAMS = {
     "pr_per_period": "{unknown}",
 }
 
+# Matches numpydoc section headers (e.g. "Parameters\n    ----------").
+# Anchoring on a word boundary avoids re-scanning every word of the docstring from each of its characters.
+_SECTION_HEADER = re.compile(r"\b(\w+\s\w+|\w{2,})\n\s+-{3,50}")
+
 
 class AttrFormatter(string.Formatter):
     """A formatter for frequently used attribute values.
@@ -60,6 +65,8 @@ class AttrFormatter(string.Formatter):
             raise ValueError("Modifier 'r' is reserved for default raw formatting.")
         self.modifiers = modifiers
         self.mapping = mapping
+        # Values already matched against the patterns of `mapping`.
+        self._matched = {}
 
     def format(self, format_string: str, /, *args: Any, **kwargs: dict) -> str:
         r"""Format a string.
@@ -74,10 +81,9 @@ class AttrFormatter(string.Formatter):
         -------
         str
         """
-        for k, v in DEFAULT_FORMAT_PARAMS.items():
-            if k not in kwargs:
-                kwargs.update({k: v})
-        return super().format(format_string, *args, **kwargs)
+        return super().format(
+            format_string, *args, **{**DEFAULT_FORMAT_PARAMS, **kwargs}
+        )
 
     def format_field(self, value, format_spec):
         """Format a value given a formatting spec.
@@ -138,9 +144,14 @@ class AttrFormatter(string.Formatter):
 
     def _match_value(self, value):
         if isinstance(value, str):
-            for mapval in self.mapping.keys():
-                if fnmatch(value, mapval):
-                    return mapval
+            # The same few values (freq, op, etc.) are formatted at every indicator call,
+            # only go through the patterns the first time each one is seen.
+            if value not in self._matched:
+                self._matched[value] = next(
+                    (mapval for mapval in self.mapping if fnmatch(value, mapval)),
+                    None,
+                )
+            return self._matched[value]
         return None
 
 
@@ -201,10 +212,19 @@ def parse_doc(doc: str) -> dict[str, str]:
     """
     if doc is None:
         return {}
+    # Many indicators share the same compute function, parse each docstring only once.
+    # The parameters' metadata is updated in-place by the indicator, give it fresh copies.
+    out = _parse_doc(doc).copy()
+    if "parameters" in out:
+        out["parameters"] = {k: v.copy() for k, v in out["parameters"].items()}
+    return out
+
 
+@lru_cache(maxsize=None)
+def _parse_doc(doc: str) -> dict[str, str]:
     out = {}
 
-    sections = re.split(r"(\w+\s?\w+)\n\s+-{3,50}", doc)  # obj.__doc__.split('\n\n')
+    sections = _SECTION_HEADER.split(doc)  # obj.__doc__.split('\n\n')
     intro = sections.pop(0)
     if intro:
         intro_content = list(map(str.strip, intro.strip().split("\n\n")))
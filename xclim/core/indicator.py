@@ -144,6 +144,7 @@ from .options import (
     MISSING_METHODS,
     MISSING_OPTIONS,
     OPTIONS,
+    RECHUNK_TIME,
 )
 from .units import check_units, convert_units_to, declare_units, units
 from .utils import (
@@ -151,10 +152,12 @@ from .utils import (
     InputKind,
     MissingVariableError,
     ValidationError,
+    _chunk_time_contiguous,
     infer_kind_from_parameter,
     is_percentile_dataarray,
     load_module,
     raise_warn_or_log,
+    uses_dask,
 )
 
 # Indicators registry
@@ -1380,6 +1383,8 @@ class ResamplingIndicator(Indicator):
     missing = "from_context"
     missing_options: dict | None = None
     allowed_periods: list[str] | None = None
+    # Whether numpy-backed inputs are computed only once for all grid cells that are null over the whole period
+    _skip_null_cells = False
 
     @classmethod
     def _ensure_correct_parameters(cls, parameters):
@@ -1404,10 +1409,48 @@ class ResamplingIndicator(Indicator):
 
         super().__init__(**kwds)
 
+    def __call__(self, *args, **kwds):
+        """Call function of Indicator class, skipping the redundant computation on null cells.
+
+        If `_skip_null_cells` is True and some grid cells are null over the whole period (e.g. outside a region
+        clipped from a larger grid), the indicator is computed over the valid cells and a single null cell only.
+        The result of that null cell is then copied to all others.
+        """
+        # The results on null cells could depend on their latitude
+        if not self._skip_null_cells or "lat" in self.parameters:
+            return super().__call__(*args, **kwds)
+
+        ba = self.__signature__.bind(*args, **kwds)
+        ba.apply_defaults()
+        self._assign_named_args(ba)
+        das = {
+            name: arg
+            for name, arg in ba.arguments.items()
+            if isinstance(arg, DataArray)
+        }
+        cells = _null_cells(das)
+        if cells is None:
+            return super().__call__(*args, **kwds)
+
+        dims, names, keep, pos = cells
+        for name in names:
+            stacked = das[name].stack(cell=dims, create_index=False)
+            ba.arguments[name] = stacked.isel(cell=keep)
+        outs = super().__call__(*ba.args, **ba.kwargs)
+
+        like = next(das[name] for name in names if "time" in das[name].dims)
+        if isinstance(outs, tuple):
+            return tuple(_scatter_cells(out, like, dims, pos) for out in outs)
+        return _scatter_cells(outs, like, dims, pos)
+
     def _preprocess_and_checks(self, das, params):
         """Perform parent's checks and also check if freq is allowed."""
         das, params = super()._preprocess_and_checks(das, params)
 
+        if OPTIONS[RECHUNK_TIME]:
+            # Computations along time stay within each chunk
+            das = {name: _chunk_time_contiguous(da) for name, da in das.items()}
+
         # Check if the period is allowed:
         if (
             self.allowed_periods is not None
@@ -1465,6 +1508,70 @@ class ResamplingIndicator(Indicator):
         return outs
 
 
+def _null_cells(
+    das: dict[str, DataArray],
+) -> tuple[list[str], list[str], np.ndarray, np.ndarray] | None:
+    """Find the grid cells where all inputs are null.
+
+    The grid cells are given by the non-temporal dimensions of the first input with a `time` dimension. Returns None
+    if an input is dask-backed or spans only some of these dimensions, or if there is at most one null cell.
+    Otherwise, returns the non-temporal dimensions, the names of the inputs spanning them, the flat indices of the
+    cells to compute (all valid cells and the first null cell) and, for each cell, its index among the computed cells.
+    """
+    timed = [da for da in das.values() if "time" in da.dims]
+    if not timed or any(uses_dask(da) for da in das.values()):
+        return None
+    dims = [d for d in timed[0].dims if d != "time"]
+    sizes = {d: timed[0].sizes[d] for d in dims}
+    if not dims:
+        return None
+
+    names = []
+    for name, da in das.items():
+        shared = {d: s for d, s in da.sizes.items() if d in sizes}
+        if shared and shared != sizes:
+            return None
+        if shared:
+            names.append(name)
+
+    def _null(da):
+        other = [d for d in da.dims if d not in sizes]
+        return da.isnull().all(other) if other else da.isnull()
+
+    # Cells where all inputs spanning them are null, including thresholds or percentiles
+    null = reduce(np.logical_and, [_null(das[name]) for name in names])
+    null = null.transpose(*dims).values.ravel()
+    if null.sum() <= 1:
+        return None
+
+    first_null = np.argmax(null)
+    keep = np.flatnonzero(~null | (np.arange(null.size) == first_null))
+    pos = np.where(
+        null,
+        np.searchsorted(keep, first_null),
+        np.searchsorted(keep, np.arange(null.size)),
+    )
+    return dims, names, keep, pos
+
+
+def _scatter_cells(
+    out: DataArray, like: DataArray, dims: list[str], pos: np.ndarray
+) -> DataArray:
+    """Expand the `cell` dimension of `out` back to the non-temporal dimensions of `like`."""
+    out = out.isel(cell=pos)
+    out = out.drop_vars([c for c in out.coords if "cell" in out[c].dims])
+    other = [d for d in out.dims if d != "cell"]
+    data = out.transpose(*other, "cell").data.reshape(
+        [out.sizes[d] for d in other] + [like.sizes[d] for d in dims]
+    )
+    coords = dict(out.coords)
+    coords.update({k: v for k, v in like.coords.items() if set(v.dims) <= set(dims)})
+    out = DataArray(
+        data, dims=other + dims, coords=coords, attrs=out.attrs, name=out.name
+    )
+    return out.transpose(*[d for d in like.dims if d in out.dims], ...)
+
+
 class ResamplingIndicatorWithIndexing(ResamplingIndicator):
     """Resampling indicator that also injects "indexer" kwargs to subset the inputs before computation."""
 
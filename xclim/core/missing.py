@@ -35,6 +35,7 @@ from .options import (
     OPTIONS,
     register_missing_method,
 )
+from .utils import _resample_reduce_kwargs
 
 __all__ = [
     "at_least_n_valid",
@@ -64,6 +65,7 @@ class MissingBase:
                 raise ValueError(
                     "`src_timestep` must be given as it cannot be inferred."
                 )
+        self._reduce_kwargs = _resample_reduce_kwargs(da, freq)
         self.null, self.count = self.prepare(da, freq, src_timestep, **indexer)
 
     @classmethod
@@ -128,7 +130,9 @@ class MissingBase:
 
         p_freq, _ = self.split_freq(freq)
 
-        c = null.sum(dim="time")
+        if p_freq:
+            # Only the periods are needed, take them from the time coordinate instead of reducing the whole array.
+            c = select_time(da.time, drop=True, **indexer).resample(time=freq).count()
 
         # Otherwise, simply use the start and end dates to find the expected number of days.
         if p_freq.endswith("S"):
@@ -214,8 +218,10 @@ class MissingAny(MissingBase):
     """
 
     def is_missing(self, null, count):  # noqa
-        cond0 = null.count(dim="time") != count  # Check total number of days
-        cond1 = null.sum(dim="time") > 0  # Check if any is missing
+        # Check total number of days
+        cond0 = null.count(dim="time", **self._reduce_kwargs) != count
+        # Check if any is missing
+        cond1 = null.sum(dim="time", **self._reduce_kwargs) > 0
         return cond0 | cond1
 
 
@@ -292,10 +298,10 @@ class MissingWMO(MissingAny):
         )
 
         # Check total number of days
-        cond0 = null.count(dim="time") != count
+        cond0 = null.count(dim="time", **self._reduce_kwargs) != count
 
         # Check if more than threshold is missing
-        cond1 = null.sum(dim="time") >= nm
+        cond1 = null.sum(dim="time", **self._reduce_kwargs) >= nm
 
         # Check for consecutive missing values
         cond2 = null.map(rl.longest_run, dim="time") >= nc
@@ -336,7 +342,11 @@ class MissingPct(MissingBase):
         if tolerance < 0 or tolerance > 1:
             raise ValueError("tolerance should be between 0 and 1.")
 
-        n = count - null.count(dim="time").fillna(0) + null.sum(dim="time").fillna(0)
+        n = (
+            count
+            - null.count(dim="time", **self._reduce_kwargs).fillna(0)
+            + null.sum(dim="time", **self._reduce_kwargs).fillna(0)
+        )
         return n / count >= tolerance
 
     @staticmethod
@@ -371,6 +381,7 @@ class AtLeastNValid(MissingBase):
 
     def __init__(self, da, freq, src_timestep, **indexer):
         # No need to compute count, so no check required on `src_timestep`.
+        self._reduce_kwargs = _resample_reduce_kwargs(da, freq)
         self.null = self.is_null(da, freq, **indexer)
         self.count = None  # Not needed
 
@@ -379,7 +390,9 @@ class AtLeastNValid(MissingBase):
 
         The result of a reduction operation is considered missing if less than `n` values are valid.
         """
-        nvalid = null.count(dim="time").fillna(0) - null.sum(dim="time").fillna(0)
+        nvalid = null.count(dim="time", **self._reduce_kwargs).fillna(0) - null.sum(
+            dim="time", **self._reduce_kwargs
+        ).fillna(0)
         return nvalid < n
 
     @staticmethod
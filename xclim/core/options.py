@@ -23,6 +23,8 @@ RUN_LENGTH_UFUNC = "run_length_ufunc"
 SDBA_EXTRA_OUTPUT = "sdba_extra_output"
 SDBA_ENCODE_CF = "sdba_encode_cf"
 KEEP_ATTRS = "keep_attrs"
+PRECIP_COMPARE_DTYPE = "precip_compare_dtype"
+RECHUNK_TIME = "rechunk_time"
 
 MISSING_METHODS: dict[str, Callable] = {}
 
@@ -36,11 +38,14 @@ OPTIONS = {
     SDBA_EXTRA_OUTPUT: False,
     SDBA_ENCODE_CF: False,
     KEEP_ATTRS: "xarray",
+    PRECIP_COMPARE_DTYPE: None,
+    RECHUNK_TIME: False,
 }
 
 _LOUDNESS_OPTIONS = frozenset(["log", "warn", "raise"])
 _RUN_LENGTH_UFUNC_OPTIONS = frozenset(["auto", True, False])
 _KEEP_ATTRS_OPTIONS = frozenset(["xarray", True, False])
+_PRECIP_COMPARE_DTYPE_OPTIONS = frozenset([None, "float16", "float32", "float64"])
 
 
 def _valid_missing_options(mopts):
@@ -67,6 +72,8 @@ _VALIDATORS = {
     SDBA_EXTRA_OUTPUT: lambda opt: isinstance(opt, bool),
     SDBA_ENCODE_CF: lambda opt: isinstance(opt, bool),
     KEEP_ATTRS: _KEEP_ATTRS_OPTIONS.__contains__,
+    PRECIP_COMPARE_DTYPE: _PRECIP_COMPARE_DTYPE_OPTIONS.__contains__,
+    RECHUNK_TIME: lambda opt: isinstance(opt, bool),
 }
 
 
@@ -177,6 +184,18 @@ class set_options:
         using the `drop_conflicts` strategy and then updated with xclim-provided attributes.
         If False, attributes from the inputs are ignored. If "xarray", xclim will use xarray's `keep_attrs` option.
         Note that xarray's "default" is equivalent to False. Default: ``"xarray"``.
+    precip_compare_dtype : {None, "float16", "float32", "float64"}
+        Data type in which the precipitation percentile thresholds are stored before being compared to the
+        precipitation, in indices such as :py:func:`xclim.indices.days_over_precip_thresh`. Day-of-year thresholds
+        are expanded to the full length of the time series, a lower precision thus reduces the memory footprint and
+        the amount of data moved. Values within the precision of the data type of the thresholds may be classified
+        differently. Note that values in kg m-2 s-1 fall below the normal range of "float16".
+        Default: ``None``, the data type of the thresholds is left unchanged.
+    rechunk_time : bool
+        Whether resampling indicators rechunk their dask-backed inputs split along `time` so that `time` is in a
+        single chunk. The other dimensions keep their chunks, which should be small enough for the whole time
+        series to fit in memory. Resampling and rolling operations then run within each chunk, with much smaller
+        task graphs, and the indices can use their single pass `numba` kernels. Default: ``False``.
 
     Examples
     --------
@@ -296,6 +296,22 @@ def str2pint(val: str) -> pint.Quantity:
         return units.Quantity(1, units2pint(val))
 
 
+@functools.lru_cache(maxsize=256)
+def _str2cfunits(ustr: str) -> str:
+    """Return the CF symbol of a units string, caching the result."""
+    return pint2cfunits(units2pint(ustr))
+
+
+@functools.lru_cache(maxsize=1024)
+def _convert_str_units(
+    source: str, target: str | units.Unit, context: str
+) -> float | int:
+    """Convert a string quantity to the target units, caching the result for repeated thresholds."""
+    target_unit = target if isinstance(target, units.Unit) else units2pint(target)
+    # Return magnitude of converted quantity. This is going to fail if units are not compatible.
+    return str2pint(source).to(target_unit, context).m
+
+
 def convert_units_to(
     source: Quantified,
     target: Quantified | units.Unit,
@@ -336,6 +352,19 @@ def convert_units_to(
     """
     context = context or "none"
 
+    if isinstance(source, str) and isinstance(target, (str, units.Unit)):
+        # Strings carry no standard name, an inferred context is always "none"
+        return _convert_str_units(
+            source, target, "none" if context == "infer" else context
+        )
+
+    if isinstance(source, xr.DataArray) and isinstance(target, (str, xr.DataArray)):
+        target_str = target if isinstance(target, str) else target.attrs.get("units")
+        if target_str is not None and source.attrs.get("units") == target_str:
+            # Same units string: no conversion, only the symbol may not be the CF one.
+            source.attrs["units"] = _str2cfunits(target_str)
+            return source
+
     # Target units
     if isinstance(target, units.Unit):
         target_unit = target
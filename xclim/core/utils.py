@@ -10,6 +10,7 @@ import importlib.util
 import logging
 import os
 import warnings
+import weakref
 from collections import defaultdict
 from enum import IntEnum
 from functools import partial
@@ -26,6 +27,12 @@ from dask import array as dsk
 from pint import Quantity
 from yaml import safe_dump, safe_load
 
+try:
+    import flox
+except ImportError:
+    # flox is not a dependency of xclim
+    flox = None
+
 logger = logging.getLogger("xclim")
 
 #: Type annotation for strings representing full dates (YYYY-MM-DD), may include time.
@@ -217,6 +224,16 @@ def ensure_chunk_size(da: xr.DataArray, **minchunks: dict[str, int]) -> xr.DataA
     return da
 
 
+def _chunk_time_contiguous(da: xr.DataArray, dim: str = "time") -> xr.DataArray:
+    """Rechunk a dask-backed array split along `dim` so that `dim` is in a single chunk.
+
+    The other dimensions keep their chunks. Other arrays are returned as is.
+    """
+    if uses_dask(da) and dim in da.dims and len(da.chunks[da.get_axis_num(dim)]) > 1:
+        return da.chunk({dim: -1})
+    return da
+
+
 def uses_dask(da: xr.DataArray) -> bool:
     """Evaluate whether dask is installed and array is loaded as a dask array.
 
@@ -237,6 +254,69 @@ def uses_dask(da: xr.DataArray) -> bool:
     return False
 
 
+def _resample_reduce_kwargs(da: xr.DataArray, freq: str | None) -> dict:
+    """Return the keyword arguments of the reductions of `da` over the periods of `freq`.
+
+    Resampling groups are sorted and contiguous. When xarray reduces them with `flox`, the "flox" engine, based on
+    `reduceat`, is much faster than the default one.
+    """
+    if (
+        freq
+        and flox is not None
+        and xr.get_options()["use_flox"]
+        and (isinstance(da.data, np.ndarray) or uses_dask(da))
+    ):
+        return {"engine": "flox"}
+    return {}
+
+
+# Values derived from the time indexes, by id of the index and then by name of the value and its parameters
+_INDEX_CACHE: dict[int, dict[tuple, xr.DataArray | np.ndarray]] = {}
+
+
+def _index_cache(da: xr.DataArray, dim: str) -> dict:
+    """Return the cache of the values derived from the index of `da` along `dim`.
+
+    Xarray shares the index between the arrays derived from the same data, so indices computed on the same data
+    find the values computed by the previous ones.
+    """
+    index = da.indexes[dim]
+    key = id(index)
+    if key not in _INDEX_CACHE:
+        _INDEX_CACHE[key] = {}
+        # Ids can be reused once the index is garbage collected
+        weakref.finalize(index, _INDEX_CACHE.pop, key, None)
+    return _INDEX_CACHE[key]
+
+
+def _period_counts(da: xr.DataArray, freq: str, dim: str = "time") -> xr.DataArray:
+    """Return the number of elements of `da` in each period of `freq` along `dim`.
+
+    Resampling the time coordinate is slow for long series. The counts are cached for each time index, so indices
+    computed on the same data resample it once. They are computed on the bare coordinate, so they don't carry the
+    scalar coordinates of `da`.
+    """
+    cache = _index_cache(da, dim)
+    if ("counts", dim, freq) not in cache:
+        index = da.indexes[dim]
+        time = xr.DataArray(index, dims=(dim,), coords={dim: index}, name=dim)
+        cache[("counts", dim, freq)] = time.resample({dim: freq}).count()
+    return cache[("counts", dim, freq)].copy()
+
+
+def _time_component(da: xr.DataArray, name: str, dim: str = "time") -> np.ndarray:
+    """Return the values of the datetime component `name` (e.g. "dayofyear") of the coordinate of `da` along `dim`.
+
+    The values are cached for each time index, like :py:func:`_period_counts`, and are read-only.
+    """
+    cache = _index_cache(da, dim)
+    if ("dt", dim, name) not in cache:
+        values = getattr(xr.DataArray(da.indexes[dim], dims=(dim,)).dt, name).values
+        values.flags.writeable = False
+        cache[("dt", dim, name)] = values
+    return cache[("dt", dim, name)]
+
+
 def calc_perc(
     arr: np.ndarray,
     percentiles: Sequence[float] = None,
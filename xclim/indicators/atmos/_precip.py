@@ -77,6 +77,7 @@ class Precip(Daily):
     """Indicator involving daily pr series."""
 
     context = "hydro"
+    _skip_null_cells = True
 
 
 class PrecipWithIndexing(ResamplingIndicatorWithIndexing):
@@ -84,6 +85,7 @@ class PrecipWithIndexing(ResamplingIndicatorWithIndexing):
 
     src_freq = "D"
     context = "hydro"
+    _skip_null_cells = True
 
 
 class PrTasxWithIndexing(ResamplingIndicatorWithIndexing):
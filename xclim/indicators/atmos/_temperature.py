@@ -89,11 +89,14 @@ __all__ = [
 class Temp(Daily):
     """Indicators involving daily temperature."""
 
+    _skip_null_cells = True
+
 
 class TempWithIndexing(ResamplingIndicatorWithIndexing):
     """Indicators involving daily temperature and adding an indexing possibility."""
 
     src_freq = "D"
+    _skip_null_cells = True
 
 
 tn_days_above = TempWithIndexing(
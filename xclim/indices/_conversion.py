@@ -5,7 +5,7 @@ import warnings
 
 import numpy as np
 import xarray as xr
-from numba import float32, float64, vectorize  # noqa
+from numba import boolean, float32, float64, guvectorize, int64, njit, vectorize  # noqa
 
 from xclim.core.calendar import date_range, datetime_to_decimal_year
 from xclim.core.units import (
@@ -234,6 +234,38 @@ def tas(tasmin: xr.DataArray, tasmax: xr.DataArray) -> xr.DataArray:
     return tas
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], float32[:], float32[:], float32[:]),
+        (float64[:], float64[:], float64[:], float64[:], float64[:]),
+    ],
+    "(),(),()->(),()",
+    nopython=True,
+    cache=True,
+)
+def _uas_vas_2_sfcwind(uas, vas, wind_thresh, wind, wind_from_dir):  # pragma: no cover
+    """Wind speed and direction, computed together from the same components."""
+    # Wind speed is the hypotenuse of "uas" and "vas"
+    speed = np.hypot(uas[0], vas[0])
+    wind[0] = speed
+
+    # Convert the angle from the mathematical standard to the meteorological standard
+    # The angle is within [-180, 180], no modulo is needed to bring the direction within [0, 360)
+    direction = 270 - np.arctan2(vas[0], uas[0]) * (180 / np.pi)
+    if direction >= 360:
+        direction -= 360
+
+    # According to the meteorological standard, calm winds must have a direction of 0°
+    # while northerly winds have a direction of 360°
+    # On the Beaufort scale, calm winds are defined as < 0.5 m/s
+    if speed < wind_thresh[0]:
+        direction = 0
+    elif direction <= 0.5:
+        # The direction rounds to 0 (half to even)
+        direction = 360
+    wind_from_dir[0] = direction
+
+
 @declare_units(uas="[speed]", vas="[speed]", calm_wind_thresh="[speed]")
 def uas_vas_2_sfcwind(
     uas: xr.DataArray, vas: xr.DataArray, calm_wind_thresh: Quantified = "0.5 m/s"
@@ -278,25 +310,38 @@ def uas_vas_2_sfcwind(
     vas = convert_units_to(vas, "m/s")
     wind_thresh = convert_units_to(calm_wind_thresh, "m/s")
 
-    # Wind speed is the hypotenuse of "uas" and "vas"
-    wind = np.hypot(uas, vas)
+    wind, wind_from_dir = xr.apply_ufunc(
+        _uas_vas_2_sfcwind,
+        uas,
+        vas,
+        _in_float_dtype_of(wind_thresh, uas, vas),
+        output_core_dims=[[], []],
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[np.result_type(uas.dtype, vas.dtype, np.float32)] * 2,
+    )
     wind.attrs["units"] = "m s-1"
-
-    # Calculate the angle
-    wind_from_dir_math = np.degrees(np.arctan2(vas, uas))
-
-    # Convert the angle from the mathematical standard to the meteorological standard
-    wind_from_dir = (270 - wind_from_dir_math) % 360.0
-
-    # According to the meteorological standard, calm winds must have a direction of 0°
-    # while northerly winds have a direction of 360°
-    # On the Beaufort scale, calm winds are defined as < 0.5 m/s
-    wind_from_dir = xr.where(wind_from_dir.round() == 0, 360, wind_from_dir)
-    wind_from_dir = xr.where(wind < wind_thresh, 0, wind_from_dir)
     wind_from_dir.attrs["units"] = "degree"
     return wind, wind_from_dir
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], float32[:], float32[:]),
+        (float64[:], float64[:], float64[:], float64[:]),
+    ],
+    "(),()->(),()",
+    nopython=True,
+    cache=True,
+)
+def _sfcwind_2_uas_vas(sfcwind, fromdir, uas, vas):  # pragma: no cover
+    """Eastward and northward wind components, computed together from the same angle."""
+    # Converts the wind direction from the meteorological standard to the mathematical standard
+    rad = np.radians((-fromdir[0] + 270) % 360.0)
+    uas[0] = sfcwind[0] * np.cos(rad)
+    vas[0] = sfcwind[0] * np.sin(rad)
+
+
 @declare_units(sfcWind="[speed]", sfcWindfromdir="[]")
 def sfcwind_2_uas_vas(
     sfcWind: xr.DataArray, sfcWindfromdir: xr.DataArray  # noqa
@@ -330,9 +375,6 @@ def sfcwind_2_uas_vas(
     # Converts the wind speed to m s-1
     sfcWind = convert_units_to(sfcWind, "m/s")  # noqa
 
-    # Converts the wind direction from the meteorological standard to the mathematical standard
-    wind_from_dir_math = (-sfcWindfromdir + 270) % 360.0
-
     # TODO: This commented part should allow us to resample subdaily wind, but needs to be cleaned up and put elsewhere.
     # if resample is not None:
     #     wind = wind.resample(time=resample).mean(dim='time', keep_attrs=True)
@@ -343,13 +385,193 @@ def sfcwind_2_uas_vas(
     #     wind_from_dir_math = np.concatenate([[degrees(phase(sum(rect(1, radians(d)) for d in angles) / len(angles)))]
     #                                       for angles in wind_from_dir_math_per_day])
 
-    uas = sfcWind * np.cos(np.radians(wind_from_dir_math))
-    vas = sfcWind * np.sin(np.radians(wind_from_dir_math))
+    uas, vas = xr.apply_ufunc(
+        _sfcwind_2_uas_vas,
+        sfcWind,
+        sfcWindfromdir,
+        output_core_dims=[[], []],
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[np.result_type(sfcWind.dtype, sfcWindfromdir.dtype, np.float32)]
+        * 2,
+    )
     uas.attrs["units"] = "m s-1"
     vas.attrs["units"] = "m s-1"
     return uas, vas
 
 
+def _in_float_dtype_of(
+    value: float | xr.DataArray, *das: xr.DataArray
+) -> np.floating | xr.DataArray:
+    """Return the threshold `value` in the floating point type of the data `das`.
+
+    Python floats are typed as float64 by numba ufuncs, which would then use their float64 loop for float32 data.
+    """
+    dtype = np.result_type(*[da.dtype for da in das], np.float32)
+    if isinstance(value, xr.DataArray):
+        return value.astype(dtype)
+    return dtype.type(value)
+
+
+_LN10 = np.log(10)
+
+
+@njit(cache=True)
+def _ln_esat_sonntag90(tas, thresh):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] of :cite:t:`sonntag_important_1990`, over water above `thresh` and ice below."""
+    # ln(100) is to convert hPa to Pa
+    if tas > thresh:
+        return (
+            np.log(100)
+            - 6096.9385 / tas
+            + 16.635794
+            + tas * (-2.711193e-2 + 1.673952e-5 * tas)
+            + 2.433502 * np.log(tas)  # numpy's log is ln
+        )
+    return (
+        np.log(100)
+        - 6024.5282 / tas
+        + 24.7219
+        + tas * (1.0613868e-2 + -1.3198825e-5 * tas)
+        + -0.49382577 * np.log(tas)
+    )
+
+
+@njit(cache=True)
+def _ln_esat_tetens30(tas, thresh):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] of :cite:t:`tetens_uber_1930`, over water above `thresh` and ice below."""
+    if tas > thresh:
+        return np.log(610.78) + 17.269388 * (tas - 273.16) / (tas - 35.86)
+    return np.log(610.78) + 21.8745584 * (tas - 273.16) / (tas - 7.66)
+
+
+@njit(cache=True)
+def _ln_esat_goffgratch46(tas, thresh):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] of :cite:t:`goff_low-pressure_1946`, over water above `thresh` and ice below."""
+    # 10**x is computed as exp(x ln(10)), and 10**x - 1 as expm1(x ln(10))
+    if tas > thresh:
+        Tb = 373.16  # Water boiling temp [K]
+        eb = 101325  # e_sat at Tb [Pa]
+        return np.log(eb) + _LN10 * (
+            -7.90298 * ((Tb / tas) - 1)
+            + 5.02808 * np.log10(Tb / tas)
+            + -1.3817e-7 * np.expm1(_LN10 * 11.344 * (1 - tas / Tb))
+            + 8.1328e-3 * np.expm1(_LN10 * -3.49149 * ((Tb / tas) - 1))
+        )
+    Tp = 273.16  # Triple-point temperature [K]
+    ep = 611.73  # e_sat at Tp [Pa]
+    return np.log(ep) + _LN10 * (
+        -9.09718 * ((Tp / tas) - 1)
+        + -3.56654 * np.log10(Tp / tas)
+        + 0.876793 * (1 - tas / Tp)
+    )
+
+
+@njit(cache=True)
+def _ln_esat_wmo08(tas, thresh):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] of the :cite:t:`world_meteorological_organization_guide_2008`, over water above `thresh` and ice below."""
+    if tas > thresh:
+        return np.log(611.2) + 17.62 * (tas - 273.16) / (tas - 30.04)
+    return np.log(611.2) + 22.46 * (tas - 273.16) / (tas - 0.54)
+
+
+@njit(cache=True)
+def _ln_esat_its90(tas, thresh):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] of :cite:t:`hardy_its-90_1998`, over water above `thresh` and ice below."""
+    # Polynomials in Horner form
+    if tas > thresh:
+        return (
+            (-2836.5744 / tas + -6028.076559) / tas
+            + 19.54263612
+            + tas
+            * (
+                -2.737830188e-2
+                + tas * (1.6261698e-5 + tas * (7.0229056e-10 + tas * -1.8680009e-13))
+            )
+            + 2.7150305 * np.log(tas)
+        )
+    return (
+        -5866.6426 / tas
+        + 22.32870244
+        + tas * (1.39387003e-2 + tas * (-3.4262402e-5 + tas * 2.7040955e-8))
+        + 6.7063522e-1 * np.log(tas)
+    )
+
+
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    cache=True,
+)
+def _saturation_vapor_pressure_sonntag90(tas, thresh):  # pragma: no cover
+    """Saturation vapour pressure [Pa] with the "sonntag90" method. See :py:func:`saturation_vapor_pressure`."""
+    return np.exp(_ln_esat_sonntag90(tas, thresh))
+
+
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    cache=True,
+)
+def _saturation_vapor_pressure_tetens30(tas, thresh):  # pragma: no cover
+    """Saturation vapour pressure [Pa] with the "tetens30" method. See :py:func:`saturation_vapor_pressure`."""
+    return np.exp(_ln_esat_tetens30(tas, thresh))
+
+
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    cache=True,
+)
+def _saturation_vapor_pressure_goffgratch46(tas, thresh):  # pragma: no cover
+    """Saturation vapour pressure [Pa] with the "goffgratch46" method. See :py:func:`saturation_vapor_pressure`."""
+    return np.exp(_ln_esat_goffgratch46(tas, thresh))
+
+
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    cache=True,
+)
+def _saturation_vapor_pressure_wmo08(tas, thresh):  # pragma: no cover
+    """Saturation vapour pressure [Pa] with the "wmo08" method. See :py:func:`saturation_vapor_pressure`."""
+    return np.exp(_ln_esat_wmo08(tas, thresh))
+
+
+@vectorize(
+    [float32(float32, float32), float64(float64, float64)],
+    cache=True,
+)
+def _saturation_vapor_pressure_its90(tas, thresh):  # pragma: no cover
+    """Saturation vapour pressure [Pa] with the "its90" method. See :py:func:`saturation_vapor_pressure`."""
+    return np.exp(_ln_esat_its90(tas, thresh))
+
+
+# Codes of the methods of the saturation vapour pressure in the kernels computing several of them at once
+_ESAT_METHODS = {
+    "sonntag90": 0,
+    "SO90": 0,
+    "tetens30": 1,
+    "TE30": 1,
+    "goffgratch46": 2,
+    "GG46": 2,
+    "wmo08": 3,
+    "WMO08": 3,
+    "its90": 4,
+    "ITS90": 4,
+}
+
+
+@njit(cache=True)
+def _ln_esat(tas, thresh, method):  # pragma: no cover
+    """Logarithm of the saturation vapour pressure [Pa] with the method of code `method`, see `_ESAT_METHODS`."""
+    if method == 0:
+        return _ln_esat_sonntag90(tas, thresh)
+    if method == 1:
+        return _ln_esat_tetens30(tas, thresh)
+    if method == 2:
+        return _ln_esat_goffgratch46(tas, thresh)
+    if method == 3:
+        return _ln_esat_wmo08(tas, thresh)
+    return _ln_esat_its90(tas, thresh)
+
+
 @declare_units(tas="[temperature]", ice_thresh="[temperature]")
 def saturation_vapor_pressure(
     tas: xr.DataArray,
@@ -400,93 +622,99 @@ def saturation_vapor_pressure(
     else:
         thresh = convert_units_to("0 K", "degK")
     tas = convert_units_to(tas, "K")
-    ref_is_water = tas > thresh
-    if method in ["sonntag90", "SO90"]:
-        e_sat = xr.where(
-            ref_is_water,
-            100
-            * np.exp(  # Where ref_is_water is True, x100 is to convert hPa to Pa
-                -6096.9385 / tas  # type: ignore
-                + 16.635794
-                + -2.711193e-2 * tas  # type: ignore
-                + 1.673952e-5 * tas**2
-                + 2.433502 * np.log(tas)  # numpy's log is ln
-            ),
-            100
-            * np.exp(  # Where ref_is_water is False (thus ref is ice)
-                -6024.5282 / tas  # type: ignore
-                + 24.7219
-                + 1.0613868e-2 * tas  # type: ignore
-                + -1.3198825e-5 * tas**2
-                + -0.49382577 * np.log(tas)
-            ),
-        )
-    elif method in ["tetens30", "TE30"]:
-        e_sat = xr.where(
-            ref_is_water,
-            610.78 * np.exp(17.269388 * (tas - 273.16) / (tas - 35.86)),
-            610.78 * np.exp(21.8745584 * (tas - 273.16) / (tas - 7.66)),
-        )
-    elif method in ["goffgratch46", "GG46"]:
-        Tb = 373.16  # Water boiling temp [K]
-        eb = 101325  # e_sat at Tb [Pa]
-        Tp = 273.16  # Triple-point temperature [K]
-        ep = 611.73  # e_sat at Tp [Pa]
-        e_sat = xr.where(
-            ref_is_water,
-            eb
-            * 10
-            ** (
-                -7.90298 * ((Tb / tas) - 1)  # type: ignore
-                + 5.02808 * np.log10(Tb / tas)  # type: ignore
-                + -1.3817e-7 * (10 ** (11.344 * (1 - tas / Tb)) - 1)
-                + 8.1328e-3 * (10 ** (-3.49149 * ((Tb / tas) - 1)) - 1)  # type: ignore
-            ),
-            ep
-            * 10
-            ** (
-                -9.09718 * ((Tp / tas) - 1)  # type: ignore
-                + -3.56654 * np.log10(Tp / tas)  # type: ignore
-                + 0.876793 * (1 - tas / Tp)
-            ),
-        )
-    elif method in ["wmo08", "WMO08"]:
-        e_sat = xr.where(
-            ref_is_water,
-            611.2 * np.exp(17.62 * (tas - 273.16) / (tas - 30.04)),
-            611.2 * np.exp(22.46 * (tas - 273.16) / (tas - 0.54)),
-        )
-    elif method in ["its90", "ITS90"]:
-        e_sat = xr.where(
-            ref_is_water,
-            np.exp(
-                -2836.5744 / tas**2
-                + -6028.076559 / tas
-                + 19.54263612
-                + -2.737830188e-2 * tas
-                + 1.6261698e-5 * tas**2
-                + 7.0229056e-10 * tas**3
-                + -1.8680009e-13 * tas**4
-                + 2.7150305 * np.log(tas)
-            ),
-            np.exp(
-                -5866.6426 / tas
-                + 22.32870244
-                + 1.39387003e-2 * tas
-                + -3.4262402e-5 * tas**2
-                + 2.7040955e-8 * tas**3
-                + 6.7063522e-1 * np.log(tas)
-            ),
-        )
-    else:
+    # Each element is computed with the equation of its reference (water or ice) only, in a single pass
+    kernel = {
+        "sonntag90": _saturation_vapor_pressure_sonntag90,
+        "SO90": _saturation_vapor_pressure_sonntag90,
+        "tetens30": _saturation_vapor_pressure_tetens30,
+        "TE30": _saturation_vapor_pressure_tetens30,
+        "goffgratch46": _saturation_vapor_pressure_goffgratch46,
+        "GG46": _saturation_vapor_pressure_goffgratch46,
+        "wmo08": _saturation_vapor_pressure_wmo08,
+        "WMO08": _saturation_vapor_pressure_wmo08,
+        "its90": _saturation_vapor_pressure_its90,
+        "ITS90": _saturation_vapor_pressure_its90,
+    }.get(method)
+    if kernel is None:
         raise ValueError(
             f"Method {method} is not in ['sonntag90', 'tetens30', 'goffgratch46', 'wmo08', 'its90']"
         )
 
+    e_sat = xr.apply_ufunc(
+        kernel,
+        tas,
+        _in_float_dtype_of(thresh, tas),
+        dask="parallelized",
+        output_dtypes=[np.result_type(tas.dtype, np.float32)],
+    )
+
     e_sat.attrs["units"] = "Pa"
     return e_sat
 
 
+@njit(cache=True)
+def _invalid_hurs(hurs, invalid):  # pragma: no cover
+    """Clip relative humidity [%] to the 0-100 range if `invalid` is 1, mask values outside of it if it is 2."""
+    if invalid == 1:
+        if hurs < 0:
+            return 0.0
+        if hurs > 100:
+            return 100.0
+    elif invalid == 2 and not 0 <= hurs <= 100:
+        return np.nan
+    return hurs
+
+
+@vectorize(
+    [
+        float32(float32, float32, float32, int64),
+        float64(float64, float64, float64, int64),
+    ],
+    cache=True,
+)
+def _relative_humidity_from_huss(huss, ps, e_sat, invalid):  # pragma: no cover
+    """Relative humidity [%] from the specific humidity and the pressure. See :py:func:`relative_humidity`.
+
+    `invalid` is as for `_invalid_hurs`.
+    """
+    w = huss / (1 - huss)
+    w_sat = 0.62198 * e_sat / (ps - e_sat)
+    return _invalid_hurs(100 * w / w_sat, invalid)
+
+
+@vectorize(
+    [float32(float32, float32, int64), float64(float64, float64, int64)],
+    cache=True,
+)
+def _relative_humidity_bohren98(tas, tdps, invalid):  # pragma: no cover
+    """Relative humidity [%] from the temperature and the dewpoint [K] with the "bohren98" method.
+
+    See :py:func:`relative_humidity`, `invalid` is as for `_invalid_hurs`.
+    """
+    L = 2.501e6  # Enthalpy of vaporization of water [J kg-1]
+    Rw = 461.5  # Gas constant of water vapour [J kg-1 K-1]
+    return _invalid_hurs(100 * np.exp(-L / Rw * (tas - tdps) / (tas * tdps)), invalid)
+
+
+@vectorize(
+    [
+        float32(float32, float32, float32, int64, int64),
+        float64(float64, float64, float64, int64, int64),
+    ],
+    cache=True,
+)
+def _relative_humidity_from_dewpoint(
+    tas, tdps, thresh, method, invalid
+):  # pragma: no cover
+    """Relative humidity [%] from the temperature and the dewpoint [K]. See :py:func:`relative_humidity`.
+
+    The ratio of the saturation vapour pressures is computed from the difference of their logarithms, with a single
+    exponential. `method` is a code of `_ESAT_METHODS`, `invalid` is as for `_invalid_hurs`.
+    """
+    hurs = 100 * np.exp(_ln_esat(tdps, thresh, method) - _ln_esat(tas, thresh, method))
+    return _invalid_hurs(hurs, invalid)
+
+
 @declare_units(
     tas="[temperature]",
     tdps="[temperature]",
@@ -583,22 +811,46 @@ def relative_humidity(
     ----------
     :cite:cts:`bohren_atmospheric_1998,lawrence_relationship_2005`
     """
+    # Code of the handling of invalid values by the kernels, see `_invalid_hurs`
+    invalid = {"clip": 1, "mask": 2}.get(invalid_values, 0)
     if method in ("bohren98", "BA90"):
         if tdps is None:
             raise ValueError("To use method 'bohren98' (BA98), dewpoint must be given.")
         tdps = convert_units_to(tdps, "degK")
         tas = convert_units_to(tas, "degK")
-        L = 2.501e6
-        Rw = (461.5,)
-        hurs = 100 * np.exp(-L * (tas - tdps) / (Rw * tas * tdps))  # type: ignore
-    elif tdps is not None:
-        e_sat_dt = saturation_vapor_pressure(
-            tas=tdps, ice_thresh=ice_thresh, method=method
+        hurs = xr.apply_ufunc(
+            _relative_humidity_bohren98,
+            tas,
+            tdps,
+            invalid,
+            join="inner",
+            dask="parallelized",
+            output_dtypes=[np.result_type(tas.dtype, tdps.dtype, np.float32)],
         )
-        e_sat_t = saturation_vapor_pressure(
-            tas=tas, ice_thresh=ice_thresh, method=method
+    elif tdps is not None:
+        if method not in _ESAT_METHODS:
+            raise ValueError(
+                f"Method {method} is not in ['sonntag90', 'tetens30', 'goffgratch46', 'wmo08', 'its90']"
+            )
+        if ice_thresh is not None:
+            thresh = convert_units_to(ice_thresh, "degK")
+        else:
+            thresh = convert_units_to("0 K", "degK")
+        tdps = convert_units_to(tdps, "K")
+        tas = convert_units_to(tas, "K")
+
+        # Both saturation vapour pressures are computed in the same pass
+        hurs = xr.apply_ufunc(
+            _relative_humidity_from_dewpoint,
+            tas,
+            tdps,
+            _in_float_dtype_of(thresh, tas, tdps),
+            _ESAT_METHODS[method],
+            invalid,
+            join="inner",
+            dask="parallelized",
+            output_dtypes=[np.result_type(tas.dtype, tdps.dtype, np.float32)],
         )
-        hurs = 100 * e_sat_dt / e_sat_t  # type: ignore
     else:
         ps = convert_units_to(ps, "Pa")
         huss = convert_units_to(huss, "")
@@ -606,18 +858,49 @@ def relative_humidity(
 
         e_sat = saturation_vapor_pressure(tas=tas, ice_thresh=ice_thresh, method=method)
 
-        w = huss / (1 - huss)
-        w_sat = 0.62198 * e_sat / (ps - e_sat)  # type: ignore
-        hurs = 100 * w / w_sat
+        hurs = xr.apply_ufunc(
+            _relative_humidity_from_huss,
+            huss,
+            ps,
+            e_sat,
+            invalid,
+            join="inner",
+            dask="parallelized",
+            output_dtypes=[
+                np.result_type(huss.dtype, ps.dtype, e_sat.dtype, np.float32)
+            ],
+        )
 
-    if invalid_values == "clip":
-        hurs = hurs.clip(0, 100)
-    elif invalid_values == "mask":
-        hurs = hurs.where((hurs <= 100) & (hurs >= 0))
     hurs.attrs["units"] = "%"
     return hurs
 
 
+@vectorize(
+    [
+        float32(float32, float32, float32, int64),
+        float64(float64, float64, float64, int64),
+    ],
+    cache=True,
+)
+def _specific_humidity(hurs, ps, e_sat, invalid):  # pragma: no cover
+    """Specific humidity from the relative humidity [1] and the pressure. See :py:func:`specific_humidity`.
+
+    Values outside of the 0 to saturation range are clipped if `invalid` is 1 and masked if it is 2.
+    """
+    w_sat = 0.62198 * e_sat / (ps - e_sat)
+    w = w_sat * hurs
+    q = w / (1 + w)
+    if invalid == 1:
+        if q < 0:
+            q = 0
+        q_sat = w_sat / (1 + w_sat)
+        if q > q_sat:
+            return q_sat
+    elif invalid == 2 and not 0 <= q <= w_sat / (1 + w_sat):
+        return np.nan
+    return q
+
+
 @declare_units(
     tas="[temperature]",
     hurs="[]",
@@ -703,16 +986,17 @@ def specific_humidity(
 
     e_sat = saturation_vapor_pressure(tas=tas, ice_thresh=ice_thresh, method=method)
 
-    w_sat = 0.62198 * e_sat / (ps - e_sat)  # type: ignore
-    w = w_sat * hurs
-    q = w / (1 + w)
-
-    if invalid_values is not None:
-        q_sat = w_sat / (1 + w_sat)
-        if invalid_values == "clip":
-            q = q.clip(0, q_sat)
-        elif invalid_values == "mask":
-            q = q.where((q <= q_sat) & (q >= 0))
+    # The invalid values are handled in the same pass
+    q = xr.apply_ufunc(
+        _specific_humidity,
+        hurs,
+        ps,
+        e_sat,
+        {"clip": 1, "mask": 2}.get(invalid_values, 0),
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[np.result_type(hurs.dtype, ps.dtype, e_sat.dtype, np.float32)],
+    )
     q.attrs["units"] = ""
     return q
 
@@ -778,6 +1062,39 @@ def specific_humidity_from_dewpoint(
     return q
 
 
+@vectorize(
+    [
+        float32(float32, float32, float32, boolean),
+        float32(float32, float64, float64, boolean),
+        float64(float64, float32, float32, boolean),
+        float64(float64, float64, float64, boolean),
+    ],
+    cache=True,
+)
+def _binary_precip_phase_kernel(pr, tas, thresh, solid):  # pragma: no cover
+    """Solid (or liquid) part of the precipitation, all solid at or below `thresh` and all liquid above."""
+    if tas <= thresh:
+        # The liquid part is pr - pr, so that it is NaN where pr is NaN, as the difference with the solid part
+        return pr if solid else pr - pr
+    return 0 if solid else pr
+
+
+def _binary_precip_phase(
+    pr: xr.DataArray, tas: xr.DataArray, thresh: Quantified, solid: bool
+) -> xr.DataArray:
+    """Solid (or liquid) precipitation with the binary method, computed in a single pass."""
+    return xr.apply_ufunc(
+        _binary_precip_phase_kernel,
+        pr,
+        tas,
+        _in_float_dtype_of(convert_units_to(thresh, tas), tas),
+        solid,
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[np.result_type(pr.dtype, np.float32)],
+    )
+
+
 @declare_units(pr="[precipitation]", tas="[temperature]", thresh="[temperature]")
 def snowfall_approximation(
     pr: xr.DataArray,
@@ -823,8 +1140,7 @@ def snowfall_approximation(
     :cite:cts:`verseghy_class_2009,melton_atmosphericvarscalcf90_2019`
     """
     if method == "binary":
-        thresh = convert_units_to(thresh, tas)
-        prsn = pr.where(tas <= thresh, 0)
+        prsn = _binary_precip_phase(pr, tas, thresh, solid=True)
 
     elif method == "brown":
         if not np.isscalar(thresh):
@@ -911,7 +1227,10 @@ def rain_approximation(
     --------
     snowfall_approximation
     """
-    prra = pr - snowfall_approximation(pr, tas, thresh=thresh, method=method)
+    if method == "binary":
+        prra = _binary_precip_phase(pr, tas, thresh, solid=False)
+    else:
+        prra = pr - snowfall_approximation(pr, tas, thresh=thresh, method=method)
     prra.attrs["units"] = pr.attrs["units"]
     return prra
 
@@ -1132,6 +1451,25 @@ def shortwave_upwelling_radiation_from_net_downwelling(
     return rsus
 
 
+@vectorize(
+    [
+        float32(float32, float32, boolean, boolean),
+        float64(float64, float64, boolean, boolean),
+    ],
+    cache=True,
+)
+def _wind_chill_index(tas, sfcWind, can, mask_invalid):  # pragma: no cover
+    """Wind chill index [degC] from the temperature [degC] and the wind [km/h]. See :py:func:`wind_chill_index`."""
+    if mask_invalid and not (tas <= 0 if can else (sfcWind > 4.828032 and tas <= 10)):
+        return np.nan
+    if can and sfcWind < 5:
+        # Slow winds
+        return tas + sfcWind * (-1.59 + 0.1345 * tas) / 5
+    # sfcWind**0.16, as one logarithm and one exponential instead of a generic power
+    V = np.exp(0.16 * np.log(sfcWind))
+    return 13.12 + 0.6215 * tas - 11.37 * V + 0.3965 * tas * V
+
+
 @declare_units(
     tas="[temperature]",
     sfcWind="[speed]",
@@ -1204,18 +1542,19 @@ def wind_chill_index(
     tas = convert_units_to(tas, "degC")
     sfcWind = convert_units_to(sfcWind, "km/h")
 
-    V = sfcWind**0.16
-    W = 13.12 + 0.6215 * tas - 11.37 * V + 0.3965 * tas * V
-
-    if method.upper() == "CAN":
-        W = xr.where(sfcWind < 5, tas + sfcWind * (-1.59 + 0.1345 * tas) / 5, W)
-    elif method.upper() != "US":
+    if method.upper() not in ["CAN", "US"]:
         raise ValueError(f"`method` must be one of 'US' and 'CAN'. Got '{method}'.")
 
-    if mask_invalid:
-        mask = {"CAN": tas <= 0, "US": (sfcWind > 4.828032) & (tas <= 10)}
-        W = W.where(mask[method.upper()])
-
+    W = xr.apply_ufunc(
+        _wind_chill_index,
+        tas,
+        sfcWind,
+        method.upper() == "CAN",
+        mask_invalid,
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[np.result_type(tas.dtype, sfcWind.dtype, np.float32)],
+    )
     W.attrs["units"] = "degC"
     return W
 
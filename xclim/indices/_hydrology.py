@@ -208,8 +208,9 @@ def snow_melt_we_max(
     xarray.DataArray
         The maximum snow melt over a given number of days for each period. [mass/area].
     """
-    # Compute change in SWE. Set melt as a positive change.
-    dsnw = snw.diff(dim="time") * -1
+    # Compute change in SWE. Set melt as a positive change, in place on the differences.
+    dsnw = snw.diff(dim="time")
+    dsnw *= -1
 
     # Sum over window
     agg = dsnw.rolling(time=window).sum()
@@ -244,8 +245,9 @@ def melt_and_precip_max(
     xarray.DataArray
         The maximum snow melt plus precipitation over a given number of days for each period. [mass/area].
     """
-    # Compute change in SWE. Set melt as a positive change.
-    dsnw = snw.diff(dim="time") * -1
+    # Compute change in SWE. Set melt as a positive change, in place on the differences.
+    dsnw = snw.diff(dim="time")
+    dsnw *= -1
 
     # Add precipitation total
     total = rate2amount(pr) + dsnw
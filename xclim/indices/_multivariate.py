@@ -1,13 +1,15 @@
 # noqa: D100
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Sequence
 
 import numpy as np
 import xarray
+from numba import boolean, float32, float64, guvectorize, int64
 
 from xclim.core.bootstrapping import percentile_bootstrap
-from xclim.core.calendar import resample_doy
+from xclim.core.calendar import adjust_doy_calendar, resample_doy
+from xclim.core.options import OPTIONS, PRECIP_COMPARE_DTYPE
 from xclim.core.units import (
     convert_units_to,
     declare_units,
@@ -16,11 +18,24 @@ from xclim.core.units import (
     str2pint,
     to_agg_units,
 )
-from xclim.core.utils import Quantified
+from xclim.core.utils import (
+    Quantified,
+    _period_counts,
+    _time_component,
+    uses_dask,
+)
 
 from . import run_length as rl
 from ._conversion import rain_approximation, snowfall_approximation
-from .generic import compare, select_resample_op, threshold_count
+from .generic import (
+    _bottleneck_rolling,
+    _resample_reduce,
+    compare,
+    diurnal_temperature_range,
+    get_op,
+    select_resample_op,
+    threshold_count,
+)
 
 # Frequencies : YS: year start, QS-DEC: seasons starting in december, MS: month start
 # See https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html
@@ -62,6 +77,26 @@ __all__ = [
 ]
 
 
+def _split_along_time(*das: xarray.DataArray) -> bool:
+    """Return True if any of the arrays is dask-backed with more than one chunk along `time`."""
+    return any(
+        uses_dask(da) and len(da.chunks[da.get_axis_num("time")]) > 1 for da in das
+    )
+
+
+def _scalar_like(da: xarray.DataArray, value: float) -> float:
+    """Return `value` in the floating point type numpy uses to compare it with the values of `da`."""
+    return np.float32(value) if da.dtype == np.float32 else float(value)
+
+
+def _as_precip_compare_dtype(thresh: xarray.DataArray) -> xarray.DataArray:
+    """Cast precipitation thresholds to the data type set by the "precip_compare_dtype" option, if any."""
+    dtype = OPTIONS[PRECIP_COMPARE_DTYPE]
+    if dtype is None:
+        return thresh
+    return thresh.astype(dtype)
+
+
 @declare_units(tasmin="[temperature]", tasmin_per="[temperature]")
 @percentile_bootstrap
 def cold_spell_duration_index(
@@ -150,6 +185,289 @@ def cold_spell_duration_index(
     return to_agg_units(out, tasmin, "count")
 
 
+@guvectorize(
+    [
+        (
+            f1[:],
+            f2[:],
+            float64[:],
+            float64[:],
+            int64[:],
+            int64[:],
+            boolean,
+            boolean,
+            int64[:],
+            float64[:],
+        )
+        for f1 in (float32, float64)
+        for f2 in (float32, float64)
+    ],
+    "(n),(n),(d),(e),(n),(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _tas_pr_per_count(
+    tas, pr, tas_per, pr_per, tas_doy, pr_doy, tas_above, pr_above, ends, out
+):  # pragma: no cover
+    """Number of days over each period when `tas` and `pr` are both beyond their day-of-year percentiles.
+
+    `tas_doy` and `pr_doy` are the positions in the percentiles of the day of year of each time step,
+    -1 where it is missing. Values are compared with ">" if `tas_above` (`pr_above`) is True, "<" otherwise.
+    The periods are given by `ends`, the (exclusive) index of their last element. Empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            if tas_doy[i] < 0 or pr_doy[i] < 0:
+                continue
+            tv, tp = tas[i], tas_per[tas_doy[i]]
+            pv, pp = pr[i], pr_per[pr_doy[i]]
+            # Comparisons with NaN are False. NaNs are replaced before comparing,
+            # vectorized comparisons of NaNs raise "invalid value" warnings.
+            valid = not (np.isnan(tv) or np.isnan(tp) or np.isnan(pv) or np.isnan(pp))
+            if not valid:
+                tv, tp, pv, pp = 0.0, 0.0, 0.0, 0.0
+            tcond = tv > tp if tas_above else tv < tp
+            pcond = pv > pp if pr_above else pv < pp
+            c += valid & tcond & pcond
+        out[p] = c
+        start = ends[p]
+
+
+def _doy_positions(
+    per: xarray.DataArray, arr: xarray.DataArray, dim: str
+) -> tuple[xarray.DataArray, np.ndarray]:
+    """Return the day-of-year percentiles along `dim` and the position of the day of year of each time step of `arr`.
+
+    Positions are -1 where the day of year is missing from `per`, the percentiles are cast to float64, which
+    compares exactly with any float data.
+    """
+    per = adjust_doy_calendar(per, arr)
+    pos = per.indexes["dayofyear"].get_indexer(_time_component(arr, "dayofyear"))
+    per = per.astype(np.float64)
+    if dim != "dayofyear":
+        per = per.rename(dayofyear=dim)
+    if uses_dask(per):
+        per = per.chunk({dim: -1})
+    return per, pos
+
+
+def _tas_pr_per_days(
+    tas: xarray.DataArray,
+    pr: xarray.DataArray,
+    tas_per: xarray.DataArray,
+    pr_per: xarray.DataArray,
+    tas_op: str,
+    pr_op: str,
+    freq: str,
+) -> xarray.DataArray:
+    """Number of days when `tas` and `pr` are both beyond their day-of-year percentiles.
+
+    Shared by the cold/warm and dry/wet days indices, `tas_op` and `pr_op` are either "<" or ">".
+    """
+    tas_per = convert_units_to(tas_per, tas)
+    pr_per = _as_precip_compare_dtype(convert_units_to(pr_per, pr, context="hydro"))
+
+    if _split_along_time(tas, pr):
+        tcond = compare(tas, tas_op, resample_doy(tas_per, tas))
+        pcond = compare(pr, pr_op, resample_doy(pr_per, pr))
+        out = np.logical_and(tcond, pcond).resample(time=freq).sum(dim="time")
+        return to_agg_units(out, tas, "count")
+
+    # The comparisons and the count are fused, the percentiles are not broadcast along time.
+    tas, pr = xarray.align(tas, pr, join="inner")
+    tas_per, tas_doy = _doy_positions(tas_per, tas, "tas_dayofyear")
+    pr_per, pr_doy = _doy_positions(pr_per, tas, "pr_dayofyear")
+    counts = _period_counts(tas, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda tas, pr, tas_per, pr_per, **kws: _tas_pr_per_count(
+            tas,
+            pr,
+            tas_per,
+            pr_per,
+            kws["tas_doy"],
+            kws["pr_doy"],
+            kws["tas_above"],
+            kws["pr_above"],
+            kws["ends"],
+        ),
+        tas,
+        pr,
+        tas_per,
+        pr_per,
+        input_core_dims=[["time"], ["time"], ["tas_dayofyear"], ["pr_dayofyear"]],
+        output_core_dims=[["period"]],
+        kwargs={
+            "tas_doy": tas_doy,
+            "pr_doy": pr_doy,
+            "tas_above": tas_op == ">",
+            "pr_above": pr_op == ">",
+            "ends": ends,
+        },
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period="time").assign_coords(time=counts.time)
+    return to_agg_units(out.transpose(*tas.dims, ...), tas, "count")
+
+
+@guvectorize(
+    [
+        (float32[:], float64[:], int64[:], int64, int64[:], float64[:]),
+        (float64[:], float64[:], int64[:], int64, int64[:], float64[:]),
+    ],
+    "(n),(d),(n),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _doy_threshold_count_per_period(
+    arr, thresh, doy, op, ends, out
+):  # pragma: no cover
+    """Number of values of `arr` meeting the condition with the threshold of their day of year, over each period.
+
+    `doy` is the position in `thresh` of the day of year of each time step, -1 where it is missing. The condition is
+    given by `op`, the index of the operator in ("gt", "lt", "ge", "le", "eq", "ne"). The periods are given by `ends`,
+    the (exclusive) index of their last element. As with numpy, NaNs and missing thresholds only meet the "ne" condition.
+    As with resampling, empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            x = arr[i]
+            t = thresh[doy[i]] if doy[i] >= 0 else np.nan
+            nan = np.isnan(x) or np.isnan(t)
+            if nan:
+                # Replaced before comparing, vectorized comparisons of NaNs raise "invalid value" warnings.
+                x, t = 0.0, 0.0
+            if op == 0:
+                met = x > t
+            elif op == 1:
+                met = x < t
+            elif op == 2:
+                met = x >= t
+            elif op == 3:
+                met = x <= t
+            elif op == 4:
+                met = x == t
+            else:
+                met = x != t
+            c += (op == 5) if nan else met
+        out[p] = c
+        start = ends[p]
+
+
+def _doy_threshold_count(
+    da: xarray.DataArray,
+    op: str,
+    per: xarray.DataArray,
+    freq: str,
+    constrain: Sequence[str],
+) -> xarray.DataArray:
+    """Count the days where `da` compared to the threshold of their day of year meets the condition.
+
+    Same as :py:func:`xclim.indices.generic.threshold_count` with thresholds created by
+    :py:func:`xclim.core.calendar.resample_doy`, but the thresholds are not broadcast along time.
+    """
+    if da.dtype not in [np.float32, np.float64] or _split_along_time(da):
+        return threshold_count(da, op, resample_doy(per, da), freq, constrain)
+
+    # Comparison and count fused, each period receives its count directly
+    opcode = ["gt", "lt", "ge", "le", "eq", "ne"].index(get_op(op, constrain).__name__)
+    per, doy = _doy_positions(per, da, "dayofyear")
+    counts = _period_counts(da, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda arr, thresh, doy, op, ends: _doy_threshold_count_per_period(
+            arr, thresh, doy, op, ends
+        ),
+        da,
+        per,
+        input_core_dims=[["time"], ["dayofyear"]],
+        output_core_dims=[["period"]],
+        kwargs={"doy": doy, "op": opcode, "ends": ends},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period="time").assign_coords(time=counts.time)
+    return out.transpose(*da.dims, ...)
+
+
+@guvectorize(
+    [
+        (float32[:], float64[:], int64[:], int64, int64[:], float32[:]),
+        (float64[:], float64[:], int64[:], int64, int64[:], float64[:]),
+    ],
+    "(n),(d),(n),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _doy_threshold_sum_per_period(arr, thresh, doy, op, ends, out):  # pragma: no cover
+    """Sum of the values of `arr` meeting the condition with the threshold of their day of year, over each period.
+
+    Same arguments as :py:func:`_doy_threshold_count_per_period`, but only the "gt" and "ge" conditions are supported.
+    NaNs and missing thresholds never meet the condition. As with xarray, empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        s = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            x = arr[i]
+            if doy[i] < 0:
+                continue
+            t = thresh[doy[i]]
+            if (op == 0 and x > t) or (op == 2 and x >= t):
+                s += x
+        out[p] = s
+        start = ends[p]
+
+
+def _doy_threshold_sum(
+    da: xarray.DataArray,
+    op: str,
+    per: xarray.DataArray,
+    freq: str,
+    constrain: Sequence[str],
+) -> xarray.DataArray:
+    """Sum the values of `da` above the threshold of their day of year over each period.
+
+    Same as summing `da.where(compare(da, op, resample_doy(per, da), constrain), 0)` over each period,
+    but the thresholds are not broadcast along time.
+    """
+    if da.dtype not in [np.float32, np.float64] or _split_along_time(da):
+        thresh = resample_doy(per, da)
+        return (
+            da.where(compare(da, op, thresh, constrain), 0)
+            .resample(time=freq)
+            .sum(dim="time")
+        )
+
+    # Comparison and sum fused, each period receives its total directly
+    opcode = ["gt", "lt", "ge", "le", "eq", "ne"].index(get_op(op, constrain).__name__)
+    per, doy = _doy_positions(per, da, "dayofyear")
+    counts = _period_counts(da, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda arr, thresh, doy, op, ends: _doy_threshold_sum_per_period(
+            arr, thresh, doy, op, ends
+        ),
+        da,
+        per,
+        input_core_dims=[["time"], ["dayofyear"]],
+        output_core_dims=[["period"]],
+        kwargs={"doy": doy, "op": opcode, "ends": ends},
+        dask="parallelized",
+        output_dtypes=[da.dtype],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period="time").assign_coords(time=counts.time)
+    return out.transpose(*da.dims, ...)
+
+
 @declare_units(
     tas="[temperature]",
     pr="[precipitation]",
@@ -202,16 +520,7 @@ def cold_and_dry_days(
     :cite:cts:`beniston_trends_2009`
 
     """
-    tas_per = convert_units_to(tas_per, tas)
-    thresh = resample_doy(tas_per, tas)
-    tg25 = tas < thresh
-
-    pr_per = convert_units_to(pr_per, pr, context="hydro")
-    thresh = resample_doy(pr_per, pr)
-    pr25 = pr < thresh
-
-    cold_and_dry = np.logical_and(tg25, pr25).resample(time=freq).sum(dim="time")
-    return to_agg_units(cold_and_dry, tas, "count")
+    return _tas_pr_per_days(tas, pr, tas_per, pr_per, "<", "<", freq)
 
 
 @declare_units(
@@ -266,16 +575,7 @@ def warm_and_dry_days(
     :cite:cts:`beniston_trends_2009`
 
     """
-    tas_per = convert_units_to(tas_per, tas)
-    thresh = resample_doy(tas_per, tas)
-    tg75 = tas > thresh
-
-    pr_per = convert_units_to(pr_per, pr, context="hydro")
-    thresh = resample_doy(pr_per, pr)
-    pr25 = pr < thresh
-
-    warm_and_dry = np.logical_and(tg75, pr25).resample(time=freq).sum(dim="time")
-    return to_agg_units(warm_and_dry, tas, "count")
+    return _tas_pr_per_days(tas, pr, tas_per, pr_per, ">", "<", freq)
 
 
 @declare_units(
@@ -329,16 +629,7 @@ def warm_and_wet_days(
     ----------
     :cite:cts:`beniston_trends_2009`
     """
-    tas_per = convert_units_to(tas_per, tas)
-    thresh = resample_doy(tas_per, tas)
-    tg75 = tas > thresh
-
-    pr_per = convert_units_to(pr_per, pr, context="hydro")
-    thresh = resample_doy(pr_per, pr)
-    pr75 = pr > thresh
-
-    warm_and_wet = np.logical_and(tg75, pr75).resample(time=freq).sum(dim="time")
-    return to_agg_units(warm_and_wet, tas, "count")
+    return _tas_pr_per_days(tas, pr, tas_per, pr_per, ">", ">", freq)
 
 
 @declare_units(
@@ -392,16 +683,80 @@ def cold_and_wet_days(
     ----------
     :cite:cts:`beniston_trends_2009`
     """
-    tas_per = convert_units_to(tas_per, tas)
-    thresh = resample_doy(tas_per, tas)
-    tg25 = tas < thresh
-
-    pr_per = convert_units_to(pr_per, pr, context="hydro")
-    thresh = resample_doy(pr_per, pr)
-    pr75 = pr > thresh
-
-    cold_and_wet = np.logical_and(tg25, pr75).resample(time=freq).sum(dim="time")
-    return to_agg_units(cold_and_wet, tas, "count")
+    return _tas_pr_per_days(tas, pr, tas_per, pr_per, "<", ">", freq)
+
+
+@guvectorize(
+    [
+        (
+            float32[:],
+            float32[:],
+            float32,
+            float32,
+            boolean,
+            boolean,
+            int64[:],
+            float64[:],
+        ),
+        (
+            float32[:],
+            float64[:],
+            float32,
+            float64,
+            boolean,
+            boolean,
+            int64[:],
+            float64[:],
+        ),
+        (
+            float64[:],
+            float32[:],
+            float64,
+            float32,
+            boolean,
+            boolean,
+            int64[:],
+            float64[:],
+        ),
+        (
+            float64[:],
+            float64[:],
+            float64,
+            float64,
+            boolean,
+            boolean,
+            int64[:],
+            float64[:],
+        ),
+    ],
+    "(n),(n),(),(),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _temperature_swing_days(
+    tasmin, tasmax, thresh_tasmin, thresh_tasmax, tasmin_le, tasmax_ge, ends, out
+):  # pragma: no cover
+    """Number of days over each period with `tasmin` under `thresh_tasmin` and `tasmax` over `thresh_tasmax`.
+
+    The comparisons include the thresholds if `tasmin_le` (`tasmax_ge`) is True. The periods are given by `ends`, the
+    (exclusive) index of their last element, empty periods are NaN. The thresholds have the data type of the array they
+    are compared with, as with numpy.
+    """
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            if tasmin_le:
+                freeze = tasmin[i] <= thresh_tasmin
+            else:
+                freeze = tasmin[i] < thresh_tasmin
+            if tasmax_ge:
+                thaw = tasmax[i] >= thresh_tasmax
+            else:
+                thaw = tasmax[i] > thresh_tasmax
+            c += freeze & thaw
+        out[p] = c
+        start = ends[p]
 
 
 @declare_units(
@@ -471,6 +826,42 @@ def multiday_temperature_swing(
     thaw_threshold = convert_units_to(thresh_tasmax, tasmax)
     freeze_threshold = convert_units_to(thresh_tasmin, tasmin)
 
+    if (
+        op == "sum"
+        and window == 1
+        and resample_before_rl
+        and np.isscalar(thaw_threshold)
+        and np.isscalar(freeze_threshold)
+        and not _split_along_time(tasmin, tasmax)
+    ):
+        # The sum of the lengths of all spells is the number of days meeting both conditions
+        freeze_op = get_op(op_tasmin, constrain=("<", "<=")).__name__
+        thaw_op = get_op(op_tasmax, constrain=(">", ">=")).__name__
+        tasmin, tasmax = xarray.align(tasmin, tasmax, join="inner")
+        counts = _period_counts(tasmin, freq)
+        ends = np.cumsum(counts.values)
+        out = xarray.apply_ufunc(
+            lambda tn, tx, thresh_tn, thresh_tx, tn_le, tx_ge, ends: _temperature_swing_days(
+                tn, tx, thresh_tn, thresh_tx, tn_le, tx_ge, ends
+            ),
+            tasmin,
+            tasmax,
+            input_core_dims=[["time"], ["time"]],
+            output_core_dims=[["period"]],
+            kwargs={
+                "thresh_tn": _scalar_like(tasmin, freeze_threshold),
+                "thresh_tx": _scalar_like(tasmax, thaw_threshold),
+                "tn_le": freeze_op == "le",
+                "tx_ge": thaw_op == "ge",
+                "ends": ends,
+            },
+            dask="parallelized",
+            output_dtypes=[np.float64],
+            dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+        )
+        out = out.rename(period="time").assign_coords(time=counts.time)
+        return to_agg_units(out.transpose(*tasmin.dims, ...), tasmin, "count")
+
     freeze = compare(tasmin, op_tasmin, freeze_threshold, constrain=("<", "<="))
     thaw = compare(tasmax, op_tasmax, thaw_threshold, constrain=(">", ">="))
     ft = freeze * thaw
@@ -534,6 +925,9 @@ def daily_temperature_range(
 
         DTR_j = \frac{ \sum_{i=1}^I (TX_{ij} - TN_{ij}) }{I}
     """
+    if isinstance(op, str):
+        return diurnal_temperature_range(tasmin, tasmax, reducer=op, freq=freq)
+
     tasmax = convert_units_to(tasmax, tasmin)
     dtr = tasmax - tasmin
     out = select_resample_op(dtr, op=op, freq=freq)
@@ -613,8 +1007,8 @@ def extreme_temperature_range(
         ETR_j = max(TX_{ij}) - min(TN_{ij})
     """
     tasmax = convert_units_to(tasmax, tasmin)
-    tx_max = tasmax.resample(time=freq).max(dim="time")
-    tn_min = tasmin.resample(time=freq).min(dim="time")
+    tx_max = _resample_reduce(tasmax, "max", freq)
+    tn_min = _resample_reduce(tasmin, "min", freq)
 
     out = tx_max - tn_min
     u = str2pint(tasmax.units)
@@ -849,6 +1243,41 @@ def heat_wave_total_length(
     return to_agg_units(out, tasmin, "count")
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], int64[:], float32, float32[:], float32[:]),
+        (float32[:], float64[:], int64[:], float64, float32[:], float32[:]),
+        (float64[:], float32[:], int64[:], float32, float64[:], float64[:]),
+        (float64[:], float64[:], int64[:], float64, float64[:], float64[:]),
+    ],
+    "(n),(n),(m),()->(m),(m)",
+    nopython=True,
+    cache=True,
+)
+def _total_and_solid_period_sums(
+    arr, tas, ends, thresh, tot, solid
+):  # pragma: no cover
+    """Sum of `arr` over each period, in total and for solid precipitation only.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. Precipitation is solid when `tas`
+    is under or equal to `thresh`, which has the data type of `tas`, as with numpy. NaNs are skipped and periods with
+    no valid values sum to 0.
+    """
+    start = 0
+    for p in range(ends.size):
+        s = 0.0
+        ss = 0.0
+        for i in range(start, ends[p]):
+            if np.isnan(arr[i]):
+                continue
+            s += arr[i]
+            if tas[i] <= thresh:
+                ss += arr[i]
+        tot[p] = s
+        solid[p] = ss
+        start = ends[p]
+
+
 @declare_units(
     pr="[precipitation]",
     prsn="[precipitation]",
@@ -900,18 +1329,77 @@ def liquid_precip_ratio(
     --------
     winter_rain_ratio
     """
-    if prsn is None and tas is not None:
-        prsn = snowfall_approximation(pr, tas=tas, thresh=thresh, method="binary")
-    elif prsn is None:
+    if prsn is None and tas is None:
         raise KeyError("prsn or tas must be supplied.")
+    fused = prsn is None and not _split_along_time(pr, tas)
+    if fused:
+        t = convert_units_to(thresh, tas)
+        fused = np.isscalar(t) and pr.indexes["time"].equals(tas.indexes["time"])
+    if fused:
+        # Total and solid precipitation summed together, without creating the snowfall array
+        counts = _period_counts(pr, freq)
+        ends = np.cumsum(counts.values)
+        tot, snow = xarray.apply_ufunc(
+            lambda arr, tas, ends, thresh: _total_and_solid_period_sums(
+                arr, tas, ends, thresh
+            ),
+            pr,
+            tas,
+            input_core_dims=[["time"], ["time"]],
+            output_core_dims=[["period"], ["period"]],
+            kwargs={"ends": ends, "thresh": _scalar_like(tas, t)},
+            dask="parallelized",
+            output_dtypes=[pr.dtype, pr.dtype],
+            dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+        )
+        tot, snow = (
+            da.rename(period="time")
+            .assign_coords(time=counts.time)
+            .transpose(*pr.dims, ...)
+            for da in (tot, snow)
+        )
+    else:
+        if prsn is None:
+            prsn = snowfall_approximation(pr, tas=tas, thresh=thresh, method="binary")
+        tot = pr.resample(time=freq).sum(dim="time")
+        snow = prsn.resample(time=freq).sum(dim="time")
 
-    tot = pr.resample(time=freq).sum(dim="time")
-    rain = tot - prsn.resample(time=freq).sum(dim="time")
+    rain = tot - snow
     ratio = rain / tot
     ratio.attrs["units"] = ""
     return ratio
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], int64[:], float32, int64, float32[:]),
+        (float32[:], float64[:], int64[:], float64, int64, float32[:]),
+        (float64[:], float32[:], int64[:], float32, int64, float64[:]),
+        (float64[:], float64[:], int64[:], float64, int64, float64[:]),
+    ],
+    "(n),(n),(m),(),()->(m)",
+    nopython=True,
+    cache=True,
+)
+def _phase_period_sum(arr, tas, ends, thresh, phase, out):  # pragma: no cover
+    """Sum of `arr` over each period, for all phases (0), liquid (1) or solid (2) precipitation only.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. Precipitation is solid when `tas`
+    is under or equal to `thresh`, which has the data type of `tas`, as with numpy. As with xarray, NaNs are skipped,
+    periods with only NaNs sum to 0 and empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        s = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            if np.isnan(arr[i]):
+                continue
+            if phase == 0 or (phase == 2) == (tas[i] <= thresh):
+                s += arr[i]
+        out[p] = s
+        start = ends[p]
+
+
 @declare_units(pr="[precipitation]", tas="[temperature]", thresh="[temperature]")
 def precip_accumulation(
     pr: xarray.DataArray,
@@ -966,12 +1454,44 @@ def precip_accumulation(
     >>> pr_day = xr.open_dataset(path_to_pr_file).pr
     >>> prcp_tot_seasonal = precip_accumulation(pr_day, freq="QS-DEC")
     """
-    if phase == "liquid":
-        pr = rain_approximation(pr, tas=tas, thresh=thresh, method="binary")
-    elif phase == "solid":
-        pr = snowfall_approximation(pr, tas=tas, thresh=thresh, method="binary")
+    phases = {None: 0, "liquid": 1, "solid": 2}
+    t = convert_units_to(thresh, tas) if phase in ["liquid", "solid"] else np.nan
+    das = [pr] if phases.get(phase) == 0 else [pr, tas]
+    if phase not in phases or not np.isscalar(t) or _split_along_time(*das):
+        if phase == "liquid":
+            pr = rain_approximation(pr, tas=tas, thresh=thresh, method="binary")
+        elif phase == "solid":
+            pr = snowfall_approximation(pr, tas=tas, thresh=thresh, method="binary")
+        pram = rate2amount(pr)
+        return pram.resample(time=freq).sum(dim="time").assign_attrs(units=pram.units)
+
+    # Phase selection and sum fused, each period receives its total directly
     pram = rate2amount(pr)
-    return pram.resample(time=freq).sum(dim="time").assign_attrs(units=pram.units)
+    if phases[phase] == 0:
+        tas = pram
+    else:
+        pram, tas = xarray.align(pram, tas, join="inner")
+    counts = _period_counts(pram, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda arr, tas, ends, thresh, phase: _phase_period_sum(
+            arr, tas, ends, thresh, phase
+        ),
+        pram,
+        tas,
+        input_core_dims=[["time"], ["time"]],
+        output_core_dims=[["period"]],
+        kwargs={"ends": ends, "thresh": _scalar_like(tas, t), "phase": phases[phase]},
+        dask="parallelized",
+        output_dtypes=[pram.dtype],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = (
+        out.rename(period="time")
+        .assign_coords(time=counts.time)
+        .transpose(*pram.dims, ...)
+    )
+    return out.assign_attrs(units=pram.units)
 
 
 @declare_units(pr="[precipitation]", tas="[temperature]", thresh="[temperature]")
@@ -1036,6 +1556,38 @@ def precip_average(
     return pram.resample(time=freq).mean(dim="time").assign_attrs(units=pram.units)
 
 
+@guvectorize(
+    [
+        (float32[:], float32[:], float32, float32, int64[:], float64[:]),
+        (float32[:], float64[:], float32, float64, int64[:], float64[:]),
+        (float64[:], float32[:], float64, float32, int64[:], float64[:]),
+        (float64[:], float64[:], float64, float64, int64[:], float64[:]),
+    ],
+    "(n),(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _rain_on_frozen_ground_count(pr, tas, thresh, frz, ends, out):  # pragma: no cover
+    """Number of days over each period with `pr` over `thresh` and `tas` over `frz` after 7 days at or below `frz`.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. The 7 previous days can belong to
+    the previous period, but the first 7 days of the series are never counted. NaN temperatures are not over `frz`.
+    The thresholds have the data type of the array they are compared with, as with numpy. Empty periods are NaN.
+    """
+    above = 0  # Number of days over freezing among the 7 previous days
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            if i >= 7 and above == 0 and tas[i] > frz and pr[i] > thresh:
+                c += 1
+            above += tas[i] > frz
+            if i >= 7:
+                above -= tas[i - 7] > frz
+        out[p] = c
+        start = ends[p]
+
+
 # FIXME: Resample after run length?
 @declare_units(pr="[precipitation]", tas="[temperature]", thresh="[precipitation]")
 def rain_on_frozen_ground_days(
@@ -1085,16 +1637,66 @@ def rain_on_frozen_ground_days(
     t = convert_units_to(thresh, pr, context="hydro")
     frz = convert_units_to("0 C", tas)
 
-    def func(x, axis):
-        """Check that temperature conditions are below 0 for seven days and above after."""
-        frozen = x == np.array([0, 0, 0, 0, 0, 0, 0, 1], bool)
-        return frozen.all(axis=axis)
-
-    tcond = (tas > frz).rolling(time=8).reduce(func)
-    pcond = pr > t
+    if not np.isscalar(t) or _split_along_time(pr, tas):
+        # Number of days over freezing among the 7 previous days, from a running sum instead of 8-day windows
+        thawed = tas > frz
+        above = _bottleneck_rolling(thawed, 7).shift(time=1)
+        cond = ((above == 0) & thawed & (pr > t)).astype(np.int8)
+
+        out = cond.resample(time=freq).sum(dim="time")
+        return to_agg_units(out, tas, "count")
+
+    # Conditions on the 8-day window of temperatures and the precipitation fused with the count
+    pr, tas = xarray.align(pr, tas, join="inner")
+    counts = _period_counts(pr, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda pr, tas, thresh, frz, ends: _rain_on_frozen_ground_count(
+            pr, tas, thresh, frz, ends
+        ),
+        pr,
+        tas,
+        input_core_dims=[["time"], ["time"]],
+        output_core_dims=[["period"]],
+        kwargs={
+            "thresh": _scalar_like(pr, t),
+            "frz": _scalar_like(tas, frz),
+            "ends": ends,
+        },
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period="time").assign_coords(time=counts.time)
+    return to_agg_units(out.transpose(*pr.dims, ...), tas, "count")
+
+
+@guvectorize(
+    [
+        (float32[:], float32[:], float32, float32, int64[:], float64[:]),
+        (float32[:], float64[:], float32, float64, int64[:], float64[:]),
+        (float64[:], float32[:], float64, float32, int64[:], float64[:]),
+        (float64[:], float64[:], float64, float64, int64[:], float64[:]),
+    ],
+    "(n),(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _high_precip_low_temp_count(
+    pr, tas, pr_thresh, tas_thresh, ends, out
+):  # pragma: no cover
+    """Number of days over each period with `pr` at or over `pr_thresh` and `tas` under `tas_thresh`.
 
-    out = (tcond * pcond * 1).resample(time=freq).sum(dim="time")
-    return to_agg_units(out, tas, "count")
+    The periods are given by `ends`, the (exclusive) index of their last element. The thresholds have the data type of
+    the array they are compared with, as with numpy. Empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            c += (pr[i] >= pr_thresh) & (tas[i] < tas_thresh)
+        out[p] = c
+        start = ends[p]
 
 
 @declare_units(
@@ -1145,9 +1747,38 @@ def high_precip_low_temp(
     pr_thresh = convert_units_to(pr_thresh, pr, context="hydro")
     tas_thresh = convert_units_to(tas_thresh, tas)
 
-    cond = (pr >= pr_thresh) * (tas < tas_thresh) * 1
-    out = cond.resample(time=freq).sum(dim="time")
-    return to_agg_units(out, pr, "count")
+    if (
+        not np.isscalar(pr_thresh)
+        or not np.isscalar(tas_thresh)
+        or _split_along_time(pr, tas)
+    ):
+        cond = ((pr >= pr_thresh) & (tas < tas_thresh)).astype(np.int8)
+        out = cond.resample(time=freq).sum(dim="time")
+        return to_agg_units(out, pr, "count")
+
+    # Both comparisons fused with the count
+    pr, tas = xarray.align(pr, tas, join="inner")
+    counts = _period_counts(pr, freq)
+    ends = np.cumsum(counts.values)
+    out = xarray.apply_ufunc(
+        lambda pr, tas, pr_thresh, tas_thresh, ends: _high_precip_low_temp_count(
+            pr, tas, pr_thresh, tas_thresh, ends
+        ),
+        pr,
+        tas,
+        input_core_dims=[["time"], ["time"]],
+        output_core_dims=[["period"]],
+        kwargs={
+            "pr_thresh": _scalar_like(pr, pr_thresh),
+            "tas_thresh": _scalar_like(tas, tas_thresh),
+            "ends": ends,
+        },
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period="time").assign_coords(time=counts.time)
+    return to_agg_units(out.transpose(*pr.dims, ...), pr, "count")
 
 
 @declare_units(pr="[precipitation]", pr_per="[precipitation]", thresh="[precipitation]")
@@ -1201,13 +1832,13 @@ def days_over_precip_thresh(
     pr_per = convert_units_to(pr_per, pr, context="hydro")
     thresh = convert_units_to(thresh, pr, context="hydro")
 
-    tp = pr_per.where(pr_per > thresh, thresh)
-    if "dayofyear" in pr_per.coords:
-        # Create time series out of doy values.
-        tp = resample_doy(tp, pr)
+    tp = _as_precip_compare_dtype(pr_per.where(pr_per > thresh, thresh))
 
     # Compute the days when precip is both over the wet day threshold and the percentile threshold.
-    out = threshold_count(pr, op, tp, freq, constrain=(">", ">="))
+    if "dayofyear" in pr_per.coords:
+        out = _doy_threshold_count(pr, op, tp, freq, constrain=(">", ">="))
+    else:
+        out = threshold_count(pr, op, tp, freq, constrain=(">", ">="))
     return to_agg_units(out, pr, "count")
 
 
@@ -1256,10 +1887,7 @@ def fraction_over_precip_thresh(
     pr_per = convert_units_to(pr_per, pr, context="hydro")
     thresh = convert_units_to(thresh, pr, context="hydro")
 
-    tp = pr_per.where(pr_per > thresh, thresh)
-    if "dayofyear" in pr_per.coords:
-        # Create time series out of doy values.
-        tp = resample_doy(tp, pr)
+    tp = _as_precip_compare_dtype(pr_per.where(pr_per > thresh, thresh))
 
     constrain = (">", ">=")
     # Total precip during wet days over period
@@ -1270,9 +1898,14 @@ def fraction_over_precip_thresh(
     )
 
     # Compute the days when precip is both over the wet day threshold and the percentile threshold.
-    over = (
-        pr.where(compare(pr, op, tp, constrain), 0).resample(time=freq).sum(dim="time")
-    )
+    if "dayofyear" in pr_per.coords:
+        over = _doy_threshold_sum(pr, op, tp, freq, constrain)
+    else:
+        over = (
+            pr.where(compare(pr, op, tp, constrain), 0)
+            .resample(time=freq)
+            .sum(dim="time")
+        )
 
     out = over / total
     out.attrs["units"] = ""
@@ -1329,11 +1962,8 @@ def tg90p(
     """
     tas_per = convert_units_to(tas_per, tas)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tas_per, tas)
-
     # Identify the days over the 90th percentile
-    out = threshold_count(tas, op, thresh, freq, constrain=(">", ">="))
+    out = _doy_threshold_count(tas, op, tas_per, freq, constrain=(">", ">="))
     return to_agg_units(out, tas, "count")
 
 
@@ -1387,11 +2017,8 @@ def tg10p(
     """
     tas_per = convert_units_to(tas_per, tas)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tas_per, tas)
-
     # Identify the days below the 10th percentile
-    out = threshold_count(tas, op, thresh, freq, constrain=("<", "<="))
+    out = _doy_threshold_count(tas, op, tas_per, freq, constrain=("<", "<="))
     return to_agg_units(out, tas, "count")
 
 
@@ -1445,11 +2072,8 @@ def tn90p(
     """
     tasmin_per = convert_units_to(tasmin_per, tasmin)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tasmin_per, tasmin)
-
     # Identify the days with min temp above 90th percentile.
-    out = threshold_count(tasmin, op, thresh, freq, constrain=(">", ">="))
+    out = _doy_threshold_count(tasmin, op, tasmin_per, freq, constrain=(">", ">="))
     return to_agg_units(out, tasmin, "count")
 
 
@@ -1503,11 +2127,8 @@ def tn10p(
     """
     tasmin_per = convert_units_to(tasmin_per, tasmin)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tasmin_per, tasmin)
-
     # Identify the days below the 10th percentile
-    out = threshold_count(tasmin, op, thresh, freq, constrain=("<", "<="))
+    out = _doy_threshold_count(tasmin, op, tasmin_per, freq, constrain=("<", "<="))
     return to_agg_units(out, tasmin, "count")
 
 
@@ -1561,11 +2182,8 @@ def tx90p(
     """
     tasmax_per = convert_units_to(tasmax_per, tasmax)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tasmax_per, tasmax)
-
     # Identify the days with max temp above 90th percentile.
-    out = threshold_count(tasmax, op, thresh, freq, constrain=(">", ">="))
+    out = _doy_threshold_count(tasmax, op, tasmax_per, freq, constrain=(">", ">="))
     return to_agg_units(out, tasmax, "count")
 
 
@@ -1619,11 +2237,8 @@ def tx10p(
     """
     tasmax_per = convert_units_to(tasmax_per, tasmax)
 
-    # Create time series out of doy values.
-    thresh = resample_doy(tasmax_per, tasmax)
-
     # Identify the days below the 10th percentile
-    out = threshold_count(tasmax, op, thresh, freq, constrain=("<", "<="))
+    out = _doy_threshold_count(tasmax, op, tasmax_per, freq, constrain=("<", "<="))
     return to_agg_units(out, tasmax, "count")
 
 
@@ -1690,7 +2305,7 @@ def tx_tn_days_above(
     events = (
         compare(tasmin, op, thresh_tasmin, constrain)
         & compare(tasmax, op, thresh_tasmax, constrain)
-    ) * 1
+    ).astype(np.int8)
     out = events.resample(time=freq).sum(dim="time")
     return to_agg_units(out, tasmin, "count")
 
@@ -1849,7 +2464,7 @@ def blowing_snow(
     snow = snd.diff(dim="time").rolling(time=window, center=False).sum()
 
     # Blowing snow conditions
-    cond = (snow >= snd_thresh) * (sfcWind >= sfcWind_thresh) * 1
+    cond = ((snow >= snd_thresh) & (sfcWind >= sfcWind_thresh)).astype(np.int8)
 
     out = cond.resample(time=freq).sum(dim="time")
     out.attrs["units"] = to_agg_units(out, snd, "count")
@@ -1,12 +1,14 @@
 # noqa: D100
 from __future__ import annotations
 
+import numpy as np
 import xarray
+from numba import float32, float64, guvectorize, int64
 
 from xclim.core.units import convert_units_to, declare_units, rate2amount, to_agg_units
-from xclim.core.utils import Quantified
+from xclim.core.utils import Quantified, _period_counts, uses_dask
 
-from .generic import threshold_count
+from .generic import _bottleneck_rolling, _resample_reduce, threshold_count
 
 # Frequencies : YS: year start, QS-DEC: seasons starting in december, MS: month start
 # See http://pandas.pydata.org/pandas-docs/stable/timeseries.html#offset-aliases
@@ -67,7 +69,7 @@ def tg_max(tas: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TNx_j = max(TN_{ij})
     """
-    return tas.resample(time=freq).max(dim="time").assign_attrs(units=tas.units)
+    return _resample_reduce(tas, "max", freq).assign_attrs(units=tas.units)
 
 
 @declare_units(tas="[temperature]")
@@ -106,7 +108,7 @@ def tg_mean(tas: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
     >>> t = xr.open_dataset(path_to_tas_file).tas
     >>> tg = tg_mean(t, freq="QS-DEC")
     """
-    return tas.resample(time=freq).mean(dim="time").assign_attrs(units=tas.units)
+    return _resample_reduce(tas, "mean", freq).assign_attrs(units=tas.units)
 
 
 @declare_units(tas="[temperature]")
@@ -136,7 +138,7 @@ def tg_min(tas: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TGn_j = min(TG_{ij})
     """
-    return tas.resample(time=freq).min(dim="time").assign_attrs(units=tas.units)
+    return _resample_reduce(tas, "min", freq).assign_attrs(units=tas.units)
 
 
 @declare_units(tasmin="[temperature]")
@@ -166,7 +168,7 @@ def tn_max(tasmin: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TNx_j = max(TN_{ij})
     """
-    return tasmin.resample(time=freq).max(dim="time").assign_attrs(units=tasmin.units)
+    return _resample_reduce(tasmin, "max", freq).assign_attrs(units=tasmin.units)
 
 
 @declare_units(tasmin="[temperature]")
@@ -196,7 +198,7 @@ def tn_mean(tasmin: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TN_{ij} = \frac{ \sum_{i=1}^{I} TN_{ij} }{I}
     """
-    return tasmin.resample(time=freq).mean(dim="time").assign_attrs(units=tasmin.units)
+    return _resample_reduce(tasmin, "mean", freq).assign_attrs(units=tasmin.units)
 
 
 @declare_units(tasmin="[temperature]")
@@ -226,7 +228,7 @@ def tn_min(tasmin: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TNn_j = min(TN_{ij})
     """
-    return tasmin.resample(time=freq).min(dim="time").assign_attrs(units=tasmin.units)
+    return _resample_reduce(tasmin, "min", freq).assign_attrs(units=tasmin.units)
 
 
 @declare_units(tasmax="[temperature]")
@@ -256,7 +258,7 @@ def tx_max(tasmax: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TXx_j = max(TX_{ij})
     """
-    return tasmax.resample(time=freq).max(dim="time").assign_attrs(units=tasmax.units)
+    return _resample_reduce(tasmax, "max", freq).assign_attrs(units=tasmax.units)
 
 
 @declare_units(tasmax="[temperature]")
@@ -286,7 +288,7 @@ def tx_mean(tasmax: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TX_{ij} = \frac{ \sum_{i=1}^{I} TX_{ij} }{I}
     """
-    return tasmax.resample(time=freq).mean(dim="time").assign_attrs(units=tasmax.units)
+    return _resample_reduce(tasmax, "mean", freq).assign_attrs(units=tasmax.units)
 
 
 @declare_units(tasmax="[temperature]")
@@ -316,7 +318,7 @@ def tx_min(tasmax: xarray.DataArray, freq: str = "YS") -> xarray.DataArray:
 
         TXn_j = min(TX_{ij})
     """
-    return tasmax.resample(time=freq).min(dim="time").assign_attrs(units=tasmax.units)
+    return _resample_reduce(tasmax, "min", freq).assign_attrs(units=tasmax.units)
 
 
 @declare_units(tasmin="[temperature]", thresh="[temperature]")
@@ -427,7 +429,43 @@ def max_1day_precipitation_amount(
     >>> pr = xr.open_dataset(path_to_pr_file).pr
     >>> rx1day = max_1day_precipitation_amount(pr, freq="YS")
     """
-    return pr.resample(time=freq).max(dim="time").assign_attrs(units=pr.units)
+    return _resample_reduce(pr, "max", freq).assign_attrs(units=pr.units)
+
+
+@guvectorize(
+    [
+        (float32[:], int64[:], int64, float32[:]),
+        (float64[:], int64[:], int64, float64[:]),
+    ],
+    "(n),(m),()->(m)",
+    nopython=True,
+    cache=True,
+)
+def _rolling_sum_max(arr, ends, window, out):  # pragma: no cover
+    """Maximum of the moving sum of `arr` over each period.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. The moving sum is computed in a
+    single pass, windows including a NaN are skipped and periods with no complete window are NaN.
+    """
+    s = 0.0
+    nans = 0
+    start = 0
+    for p in range(ends.size):
+        mx = -np.inf
+        for i in range(start, ends[p]):
+            if np.isnan(arr[i]):
+                nans += 1
+            else:
+                s += arr[i]
+            if i >= window:
+                if np.isnan(arr[i - window]):
+                    nans -= 1
+                else:
+                    s -= arr[i - window]
+            if i >= window - 1 and nans == 0 and s > mx:
+                mx = s
+        out[p] = mx if mx > -np.inf else np.nan
+        start = ends[p]
 
 
 @declare_units(pr="[precipitation]")
@@ -461,10 +499,31 @@ def max_n_day_precipitation_amount(
     >>> pr = xr.open_dataset(path_to_pr_file).pr
     >>> out = max_n_day_precipitation_amount(pr, window=5, freq="YS")
     """
-    # Rolling sum of the values
     pram = rate2amount(pr)
-    arr = pram.rolling(time=window).sum(skipna=False)
-    return arr.resample(time=freq).max(dim="time").assign_attrs(units=pram.units)
+    if uses_dask(pram) and len(pram.chunks[pram.get_axis_num("time")]) > 1:
+        # Rolling sum of the values, with a moving window crossing chunks
+        arr = _bottleneck_rolling(pram, window, "sum")
+        out = _resample_reduce(arr, "max", freq)
+    else:
+        # Rolling sum and maximum fused, each period receives its maximum directly
+        counts = _period_counts(pram, freq)
+        ends = np.cumsum(counts.values)
+        out = xarray.apply_ufunc(
+            lambda arr, ends, window: _rolling_sum_max(arr, ends, window),
+            pram,
+            input_core_dims=[["time"]],
+            output_core_dims=[["period"]],
+            kwargs={"ends": ends, "window": window},
+            dask="parallelized",
+            output_dtypes=[pram.dtype],
+            dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+        )
+        out = (
+            out.rename(period="time")
+            .assign_coords(time=counts.time)
+            .transpose(*pram.dims)
+        )
+    return out.assign_attrs(units=pram.units)
 
 
 @declare_units(pr="[precipitation]")
@@ -498,9 +557,9 @@ def max_pr_intensity(
     >>> pr = xr.open_dataset(path_to_pr_file).pr
     >>> out = max_pr_intensity(pr, window=5, freq="YS")
     """
-    # Rolling sum of the values
-    arr = pr.rolling(time=window).mean(skipna=False)
-    out = arr.resample(time=freq).max(dim="time")
+    # Rolling mean of the values
+    arr = _bottleneck_rolling(pr, window, "mean")
+    out = _resample_reduce(arr, "max", freq)
 
     out.attrs["units"] = pr.units
     return out
@@ -527,7 +586,7 @@ def snow_depth(
     xarray.DataArray, [same units as snd]
         The mean daily snow depth at the given time frequency
     """
-    return snd.resample(time=freq).mean(dim="time").assign_attrs(units=snd.units)
+    return _resample_reduce(snd, "mean", freq).assign_attrs(units=snd.units)
 
 
 @declare_units(sfcWind="[speed]")
@@ -566,7 +625,7 @@ def sfcWind_max(sfcWind: xarray.DataArray, freq: str = "YS") -> xarray.DataArray
     >>> fg = xr.open_dataset(path_to_sfcWind_file).sfcWind
     >>> fg_max = sfcWind_max(fg, freq="QS-DEC")
     """
-    return sfcWind.resample(time=freq).max(dim="time").assign_attrs(units=sfcWind.units)
+    return _resample_reduce(sfcWind, "max", freq).assign_attrs(units=sfcWind.units)
 
 
 @declare_units(sfcWind="[speed]")
@@ -605,9 +664,7 @@ def sfcWind_mean(sfcWind: xarray.DataArray, freq: str = "YS") -> xarray.DataArra
     >>> fg = xr.open_dataset(path_to_sfcWind_file).sfcWind
     >>> fg_mean = sfcWind_mean(fg, freq="QS-DEC")
     """
-    return (
-        sfcWind.resample(time=freq).mean(dim="time").assign_attrs(units=sfcWind.units)
-    )
+    return _resample_reduce(sfcWind, "mean", freq).assign_attrs(units=sfcWind.units)
 
 
 @declare_units(sfcWind="[speed]")
@@ -646,7 +703,7 @@ def sfcWind_min(sfcWind: xarray.DataArray, freq: str = "YS") -> xarray.DataArray
     >>> fg = xr.open_dataset(path_to_sfcWind_file).sfcWind
     >>> fg_min = sfcWind_min(fg, freq="QS-DEC")
     """
-    return sfcWind.resample(time=freq).min(dim="time").assign_attrs(units=sfcWind.units)
+    return _resample_reduce(sfcWind, "min", freq).assign_attrs(units=sfcWind.units)
 
 
 @declare_units(sfcWindmax="[speed]")
@@ -684,10 +741,8 @@ def sfcWindmax_max(sfcWindmax: xarray.DataArray, freq: str = "YS") -> xarray.Dat
     >>> from xclim.indices import sfcWindmax_max
     >>> max_sfcWindmax = sfcWindmax_max(sfcWindmax_dataset, freq="QS-DEC")
     """
-    return (
-        sfcWindmax.resample(time=freq)
-        .max(dim="time")
-        .assign_attrs(units=sfcWindmax.units)
+    return _resample_reduce(sfcWindmax, "max", freq).assign_attrs(
+        units=sfcWindmax.units
     )
 
 
@@ -726,10 +781,8 @@ def sfcWindmax_mean(sfcWindmax: xarray.DataArray, freq: str = "YS") -> xarray.Da
     >>> from xclim.indices import sfcWindmax_mean
     >>> mean_sfcWindmax = sfcWindmax_mean(sfcWindmax_dataset, freq="QS-DEC")
     """
-    return (
-        sfcWindmax.resample(time=freq)
-        .mean(dim="time")
-        .assign_attrs(units=sfcWindmax.units)
+    return _resample_reduce(sfcWindmax, "mean", freq).assign_attrs(
+        units=sfcWindmax.units
     )
 
 
@@ -768,8 +821,6 @@ def sfcWindmax_min(sfcWindmax: xarray.DataArray, freq: str = "YS") -> xarray.Dat
     >>> from xclim.indices import sfcWindmax_min
     >>> min_sfcWindmax = sfcWindmax_min(sfcWindmax_dataset, freq="QS-DEC")
     """
-    return (
-        sfcWindmax.resample(time=freq)
-        .min(dim="time")
-        .assign_attrs(units=sfcWindmax.units)
+    return _resample_reduce(sfcWindmax, "min", freq).assign_attrs(
+        units=sfcWindmax.units
     )
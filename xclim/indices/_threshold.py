@@ -20,6 +20,7 @@ from xclim.core.utils import DayOfYearStr, Quantified
 
 from . import run_length as rl
 from .generic import (
+    _bottleneck_rolling,
     compare,
     cumulative_difference,
     domain_count,
@@ -619,8 +620,9 @@ def daily_pr_intensity(
     # sum over wanted period
     s = pram_wd.resample(time=freq).sum(dim="time")
 
-    # get number of wetdays over period
-    wd = wetdays(pr, thresh=thresh, freq=freq)
+    # get number of wetdays over period, reusing the wet days mask
+    wd = comparison.astype(np.int8).resample(time=freq).sum(dim="time")
+    wd = to_agg_units(wd, pr, "count")
     out = s / wd
     out.attrs["units"] = f"{str2pint(pram.units) / str2pint(wd.units):~}"
     return out
@@ -980,12 +982,7 @@ def growing_season_length(
     thresh = convert_units_to(thresh, tas)
     cond = compare(tas, op, thresh, constrain=(">=", ">"))
 
-    out = cond.resample(time=freq).map(
-        rl.season_length,
-        window=window,
-        date=mid_date,
-        dim="time",
-    )
+    out = rl.season_length(cond, window=window, date=mid_date, dim="time", freq=freq)
     return to_agg_units(out, tas, "count")
 
 
@@ -1061,12 +1058,7 @@ def frost_season_length(
     thresh = convert_units_to(thresh, tasmin)
     cond = compare(tasmin, op, thresh, constrain=("<=", "<"))
 
-    out = cond.resample(time=freq).map(
-        rl.season_length,
-        window=window,
-        date=mid_date,
-        dim="time",
-    )
+    out = rl.season_length(cond, window=window, date=mid_date, dim="time", freq=freq)
     return to_agg_units(out, tasmin, "count")
 
 
@@ -1244,12 +1236,7 @@ def frost_free_season_length(
     thresh = convert_units_to(thresh, tasmin)
     cond = compare(tasmin, op, thresh, constrain=(">=", ">"))
 
-    out = cond.resample(time=freq).map(
-        rl.season_length,
-        window=window,
-        date=mid_date,
-        dim="time",
-    )
+    out = rl.season_length(cond, window=window, date=mid_date, dim="time", freq=freq)
     return to_agg_units(out, tasmin, "count")
 
 
@@ -1474,12 +1461,7 @@ def first_snowfall(
     thresh = convert_units_to(thresh, prsn, context="hydro")
     cond = prsn >= thresh
 
-    out = cond.resample(time=freq).map(
-        rl.first_run,
-        window=1,
-        dim="time",
-        coord="dayofyear",
-    )
+    out = rl.first_run(cond, window=1, dim="time", freq=freq, coord="dayofyear")
     out.attrs.update(units="", is_dayofyear=np.int32(1), calendar=get_calendar(prsn))
     return out
 
@@ -1538,12 +1520,7 @@ def last_snowfall(
     thresh = convert_units_to(thresh, prsn, context="hydro")
     cond = prsn >= thresh
 
-    out = cond.resample(time=freq).map(
-        rl.last_run,
-        window=1,
-        dim="time",
-        coord="dayofyear",
-    )
+    out = rl.last_run(cond, window=1, dim="time", freq=freq, coord="dayofyear")
     out.attrs.update(units="", is_dayofyear=np.int32(1), calendar=get_calendar(prsn))
     return out
 
@@ -2461,9 +2438,9 @@ def wetdays_prop(
     """
     thresh = convert_units_to(thresh, pr, "hydro")
 
-    wd = compare(pr, op, thresh, constrain=(">", ">="))
-    fwd = wd.resample(time=freq).mean(dim="time").assign_attrs(units="1")
-    return fwd
+    wd = threshold_count(pr, op, thresh, freq, constrain=(">", ">="))
+    fwd = wd / pr.time.resample(time=freq).count()
+    return fwd.assign_attrs(units="1")
 
 
 # NOTE : A spell index could be used below
@@ -3022,7 +2999,7 @@ def dry_spell_frequency(
     pram = rate2amount(convert_units_to(pr, "mm/d", context="hydro"), out_units="mm")
     thresh = convert_units_to(thresh, pram, context="hydro")
 
-    agg_pr = getattr(pram.rolling(time=window, center=True), op)()
+    agg_pr = _bottleneck_rolling(pram, window, op, center=True)
     cond = agg_pr < thresh
     out = rl.resample_and_rl(
         cond,
@@ -3085,8 +3062,8 @@ def dry_spell_total_length(
     thresh = convert_units_to(thresh, pram, context="hydro")
 
     pram_pad = pram.pad(time=(0, window))
-    mask = getattr(pram_pad.rolling(time=window), op)() < thresh
-    dry = (mask.rolling(time=window).sum() >= 1).shift(time=-(window - 1))
+    mask = _bottleneck_rolling(pram_pad, window, op) < thresh
+    dry = (_bottleneck_rolling(mask, window, "max") >= 1).shift(time=-(window - 1))
     dry = dry.isel(time=slice(0, pram.time.size)).astype(float)
 
     dry = select_time(dry, **indexer)
@@ -3151,8 +3128,8 @@ def dry_spell_max_length(
     thresh = convert_units_to(thresh, pram, context="hydro")
 
     pram_pad = pram.pad(time=(0, window))
-    mask = getattr(pram_pad.rolling(time=window), op)() < thresh
-    dry = (mask.rolling(time=window).sum() >= 1).shift(time=-(window - 1))
+    mask = _bottleneck_rolling(pram_pad, window, op) < thresh
+    dry = (_bottleneck_rolling(mask, window, "max") >= 1).shift(time=-(window - 1))
     dry = dry.isel(time=slice(0, pram.time.size)).astype(float)
 
     dry = select_time(dry, **indexer)
@@ -3215,7 +3192,7 @@ def wet_spell_frequency(
     pram = rate2amount(convert_units_to(pr, "mm/d", context="hydro"), out_units="mm")
     thresh = convert_units_to(thresh, pram, context="hydro")
 
-    agg_pr = getattr(pram.rolling(time=window, center=True), op)()
+    agg_pr = _bottleneck_rolling(pram, window, op, center=True)
     cond = agg_pr >= thresh
     out = rl.resample_and_rl(
         cond,
@@ -3278,8 +3255,8 @@ def wet_spell_total_length(
     thresh = convert_units_to(thresh, pram, context="hydro")
 
     pram_pad = pram.pad(time=(0, window))
-    mask = getattr(pram_pad.rolling(time=window), op)() >= thresh
-    wet = (mask.rolling(time=window).sum() < 1).shift(time=-(window - 1))
+    mask = _bottleneck_rolling(pram_pad, window, op) >= thresh
+    wet = (_bottleneck_rolling(mask, window, "max") < 1).shift(time=-(window - 1))
     wet = wet.isel(time=slice(0, pram.time.size)).astype(float)
 
     wet = select_time(wet, **indexer)
@@ -3344,8 +3321,8 @@ def wet_spell_max_length(
     thresh = convert_units_to(thresh, pram, context="hydro")
 
     pram_pad = pram.pad(time=(0, window))
-    mask = getattr(pram_pad.rolling(time=window), op)() >= thresh
-    wet = (mask.rolling(time=window).sum() < 1).shift(time=-(window - 1))
+    mask = _bottleneck_rolling(pram_pad, window, op) >= thresh
+    wet = (_bottleneck_rolling(mask, window, "max") < 1).shift(time=-(window - 1))
     wet = wet.isel(time=slice(0, pram.time.size)).astype(float)
 
     wet = select_time(wet, **indexer)
@@ -203,7 +203,7 @@ DAY_LENGTH_FACTORS = np.array(
 )
 
 
-@njit
+@njit(cache=True)
 def _day_length(lat: int | float, mth: int):  # pragma: no cover
     """Return the average day length for a month within latitudinal bounds."""
     if -30 > lat >= -90:
@@ -223,7 +223,7 @@ def _day_length(lat: int | float, mth: int):  # pragma: no cover
     return dl[mth - 1]
 
 
-@njit
+@njit(cache=True)
 def _day_length_factor(lat: float, mth: int):  # pragma: no cover
     """Return the day length factor."""
     if -15 > lat >= -90:
@@ -239,7 +239,7 @@ def _day_length_factor(lat: float, mth: int):  # pragma: no cover
     return dlf[mth - 1]
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _fine_fuel_moisture_code(t, p, w, h, ffmc0):  # pragma: no cover
     """Compute the fine fuel moisture code over one time step.
 
@@ -318,7 +318,7 @@ def _fine_fuel_moisture_code(t, p, w, h, ffmc0):  # pragma: no cover
     return ffmc
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _duff_moisture_code(
     t: np.ndarray,
     p: np.ndarray,
@@ -385,7 +385,7 @@ def _duff_moisture_code(
     return dmc
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _drought_code(
     t: np.ndarray, p: np.ndarray, mth: np.ndarray, lat: float, dc0: float
 ) -> np.ndarray:  # pragma: no cover
@@ -517,7 +517,7 @@ def daily_severity_rating(fwi: np.ndarray) -> np.ndarry:
     return 0.0272 * fwi**1.77
 
 
-@vectorize(nopython=True)
+@vectorize(nopython=True, cache=True)
 def _overwintering_drought_code(DCf, wpr, a, b, minDC):  # pragma: no cover
     """Compute the season-starting drought code based on the previous season's last drought code and the total winter precipitation.
 
@@ -634,6 +634,12 @@ def _fire_weather_calc(
     """Primary function computing all Fire Weather Indexes. DO NOT CALL DIRECTLY, use `fire_weather_ufunc` instead."""
     # Dear code reader, sorry.
     outputs = params["outputs"]
+    # The computation iterates over time, the last axis. Using the Fortran order makes
+    # each time step contiguous in memory, the outputs created with `full_like` follow.
+    tas, pr, rh, ws, snd, mth, season_mask = (
+        np.asfortranarray(arr) if arr is not None else None
+        for arr in (tas, pr, rh, ws, snd, mth, season_mask)
+    )
     ind_prevs = {"DC": dc0.copy(), "DMC": dmc0.copy(), "FFMC": ffmc0.copy()}
 
     season_method = params.get("season_method")
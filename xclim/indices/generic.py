@@ -9,9 +9,12 @@ from __future__ import annotations
 import warnings
 from typing import Callable, Sequence
 
+import bottleneck as bn
 import cftime
 import numpy as np
 import xarray as xr
+from dask import array as dsk
+from numba import boolean, float32, float64, guvectorize, int64
 from xarray.coding.cftime_offsets import _MONTH_ABBREVIATIONS  # noqa
 
 from xclim.core.calendar import (
@@ -27,7 +30,13 @@ from xclim.core.units import (
     str2pint,
     to_agg_units,
 )
-from xclim.core.utils import DayOfYearStr, Quantified
+from xclim.core.utils import (
+    DayOfYearStr,
+    Quantified,
+    _period_counts,
+    _resample_reduce_kwargs,
+    uses_dask,
+)
 
 from . import run_length as rl
 
@@ -85,11 +94,21 @@ def select_resample_op(
         The maximum value for each period.
     """
     da = select_time(da, **indexer)
-    r = da.resample(time=freq)
     if isinstance(op, str):
-        return getattr(r, op)(dim="time", keep_attrs=True)
+        return _resample_reduce(da, op, freq, keep_attrs=True)
+
+    return da.resample(time=freq).map(op)
 
-    return r.map(op)
+
+def _resample_reduce(da: xr.DataArray, op: str, freq: str, **kwargs) -> xr.DataArray:
+    """Reduce `da` over each period with the `op` method of its resampler.
+
+    The "flox" engine is used for the reductions it supports, see :py:func:`xclim.core.utils._resample_reduce_kwargs`.
+    Its sums are accumulated sequentially, they are only used when this does not lose precision compared to xarray.
+    """
+    if op in ["min", "max"] or (op in ["mean", "sum"] and da.dtype != np.float32):
+        kwargs.update(_resample_reduce_kwargs(da, freq))
+    return getattr(da.resample(time=freq), op)(dim="time", **kwargs)
 
 
 def doymax(da: xr.DataArray) -> xr.DataArray:
@@ -125,6 +144,59 @@ def default_freq(**indexer) -> str:
     return freq
 
 
+def _bottleneck_rolling(
+    da: xr.DataArray,
+    window: int,
+    reducer: str = "sum",
+    dim: str = "time",
+    center: bool = False,
+) -> xr.DataArray:
+    """Moving window reduction using bottleneck's running algorithms.
+
+    Equivalent to ``da.rolling({dim: window}, center=center).<reducer>(skipna=False)``: by default, the result is
+    indexed with the last element of the window and windows with any missing value are NaN. Bottleneck's ``move_*`` functions cost O(1) per element,
+    whatever the window size. For dask-backed arrays, the computation is mapped over chunks with an overlap of
+    ``window - 1`` elements, which also works when the chunks along `dim` are smaller than the window.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        Input data.
+    window : int
+        Size of the moving window.
+    reducer : {'sum', 'mean', 'max', 'min', 'std', 'var'}
+        Reducing operation, the name of a bottleneck ``move_*`` function.
+    dim : str
+        Dimension along which to roll.
+    center : bool
+        If True, the result is indexed with the center of the window, as with xarray's rolling.
+
+    Returns
+    -------
+    xr.DataArray
+    """
+    func = getattr(bn, f"move_{reducer}")
+    if da.dtype.kind != "f":
+        da = da.astype(float)
+    axis = da.get_axis_num(dim)
+    if uses_dask(da):
+        data = dsk.map_overlap(
+            func,
+            da.data,
+            depth={axis: window - 1},
+            boundary=np.nan,
+            dtype=da.dtype,
+            window=window,
+            axis=axis,
+        )
+    else:
+        data = func(da.values, window=window, axis=axis)
+    out = da.copy(data=data)
+    if center:
+        out = out.shift({dim: -((window - 1) // 2)})
+    return out
+
+
 def get_op(op: str, constrain: Sequence[str] | None = None) -> Callable:
     """Get python's comparing function according to its name of representation and validate allowed usage.
 
@@ -192,6 +264,43 @@ def compare(
     return get_op(op, constrain)(left, right)
 
 
+@guvectorize(
+    [
+        (float32[:], float32, int64, int64[:], float64[:]),
+        (float64[:], float64, int64, int64[:], float64[:]),
+    ],
+    "(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _threshold_count_per_period(arr, thresh, op, ends, out):  # pragma: no cover
+    """Number of values of `arr` meeting the condition over each period.
+
+    The condition is given by `op`, the index of the operator in ("gt", "lt", "ge", "le", "eq", "ne"). The periods are
+    given by `ends`, the (exclusive) index of their last element. As with numpy, NaNs only meet the "ne" condition.
+    `thresh` has the data type of `arr`, so that values are compared as numpy would compare them to a scalar.
+    As with resampling, empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        c = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            if op == 0:
+                c += arr[i] > thresh
+            elif op == 1:
+                c += arr[i] < thresh
+            elif op == 2:
+                c += arr[i] >= thresh
+            elif op == 3:
+                c += arr[i] <= thresh
+            elif op == 4:
+                c += arr[i] == thresh
+            else:
+                c += arr[i] != thresh
+        out[p] = c
+        start = ends[p]
+
+
 def threshold_count(
     da: xr.DataArray,
     op: str,
@@ -223,8 +332,31 @@ def threshold_count(
     if constrain is None:
         constrain = (">", "<", ">=", "<=")
 
-    c = compare(da, op, threshold, constrain) * 1
-    return c.resample(time=freq).sum(dim="time")
+    if (
+        not np.isscalar(threshold)
+        or da.dtype not in [np.float32, np.float64]
+        or (uses_dask(da) and len(da.chunks[da.get_axis_num("time")]) > 1)
+    ):
+        c = compare(da, op, threshold, constrain).astype(np.int8)
+        return c.resample(time=freq).sum(dim="time")
+
+    # Comparison and count fused, each period receives its count directly
+    opcode = ["gt", "lt", "ge", "le", "eq", "ne"].index(get_op(op, constrain).__name__)
+    counts = _period_counts(da, freq)
+    ends = np.cumsum(counts.values)
+    out = xr.apply_ufunc(
+        lambda arr, thresh, op, ends: _threshold_count_per_period(
+            arr, thresh, op, ends
+        ),
+        da,
+        input_core_dims=[["time"]],
+        output_core_dims=[["period"]],
+        kwargs={"thresh": da.dtype.type(threshold), "op": opcode, "ends": ends},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    return out.rename(period="time").assign_coords(time=counts.time).transpose(*da.dims)
 
 
 def domain_count(
@@ -254,7 +386,7 @@ def domain_count(
     xr.DataArray
         The number of days where value is within [low, high] for each period.
     """
-    c = compare(da, ">", low) * compare(da, "<=", high) * 1
+    c = (compare(da, ">", low) & compare(da, "<=", high)).astype(np.int8)
     return c.resample(time=freq).sum(dim="time")
 
 
@@ -383,6 +515,50 @@ def count_occurrences(
     return to_agg_units(out, data, "count", dim="time")
 
 
+# Reductions of `_difference_period_reduce`, in the order of their codes
+_difference_reducers = ["max", "min", "mean", "sum"]
+
+
+@guvectorize(
+    [
+        (float32[:], float32[:], int64, int64[:], float32[:]),
+        (float64[:], float64[:], int64, int64[:], float64[:]),
+    ],
+    "(n),(n),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _difference_period_reduce(low, high, reducer, ends, out):  # pragma: no cover
+    """Reduce the differences `high - low` over each period.
+
+    `reducer` is the index of the reduction in `_difference_reducers`. The periods are given by `ends`, the
+    (exclusive) index of their last element. As with xarray, NaNs are skipped and empty periods are NaN. Periods
+    with only NaNs are also NaN, except for the sum, which is 0.
+    """
+    start = 0
+    for p in range(ends.size):
+        s = 0.0
+        n = 0
+        for i in range(start, ends[p]):
+            d = high[i] - low[i]
+            if np.isnan(d):
+                continue
+            if reducer == 0:
+                s = d if n == 0 or d > s else s
+            elif reducer == 1:
+                s = d if n == 0 or d < s else s
+            else:
+                s += d
+            n += 1
+        if n == 0 and (reducer != 3 or ends[p] == start):
+            out[p] = np.nan
+        elif reducer == 2:
+            out[p] = s / n
+        else:
+            out[p] = s
+        start = ends[p]
+
+
 def diurnal_temperature_range(
     low_data: xr.DataArray, high_data: xr.DataArray, reducer: str, freq: str
 ) -> xr.DataArray:
@@ -406,8 +582,37 @@ def diurnal_temperature_range(
     """
     high_data = convert_units_to(high_data, low_data)
 
-    dtr = high_data - low_data
-    out = getattr(dtr.resample(time=freq), reducer)()
+    if (
+        reducer not in _difference_reducers
+        or low_data.dtype not in [np.float32, np.float64]
+        or high_data.dtype != low_data.dtype
+        or any(
+            uses_dask(da) and len(da.chunks[da.get_axis_num("time")]) > 1
+            for da in [low_data, high_data]
+        )
+    ):
+        dtr = high_data - low_data
+        out = _resample_reduce(dtr, reducer, freq)
+    else:
+        # Differences and reduction fused, the differences are never stored
+        low_data, high_data = xr.align(low_data, high_data, join="inner")
+        counts = _period_counts(low_data, freq)
+        ends = np.cumsum(counts.values)
+        out = xr.apply_ufunc(
+            lambda low, high, reducer, ends: _difference_period_reduce(
+                low, high, reducer, ends
+            ),
+            low_data,
+            high_data,
+            input_core_dims=[["time"], ["time"]],
+            output_core_dims=[["period"]],
+            kwargs={"reducer": _difference_reducers.index(reducer), "ends": ends},
+            dask="parallelized",
+            output_dtypes=[low_data.dtype],
+            dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+        )
+        out = out.rename(period="time").assign_coords(time=counts.time)
+        out = out.transpose(*high_data.dims, ...)
 
     u = str2pint(low_data.units)
     out.attrs["units"] = pint2cfunits(u - u)
@@ -807,6 +1012,34 @@ def aggregate_between_dates(
     return xr.concat(out, dim="time")
 
 
+@guvectorize(
+    [
+        (float32[:], float32, boolean, int64[:], float32[:]),
+        (float64[:], float64, boolean, int64[:], float64[:]),
+    ],
+    "(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _cumulative_difference_per_period(
+    arr, thresh, below, ends, out
+):  # pragma: no cover
+    """Sum of the positive differences between `arr` and `thresh` over each period.
+
+    The differences are `thresh - arr` if `below` is True, `arr - thresh` otherwise. The periods are given by `ends`,
+    the (exclusive) index of their last element. As with xarray, NaNs are skipped and empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        s = 0.0 if ends[p] > start else np.nan
+        for i in range(start, ends[p]):
+            d = thresh - arr[i] if below else arr[i] - thresh
+            if d > 0:
+                s += d
+        out[p] = s
+        start = ends[p]
+
+
 def cumulative_difference(
     data: xr.DataArray, threshold: Quantified, op: str, freq: str | None = None
 ) -> xr.DataArray:
@@ -832,16 +1065,57 @@ def cumulative_difference(
     threshold = convert_units_to(threshold, data)
 
     if op in ["<", "<=", "lt", "le"]:
-        diff = (threshold - data).clip(0)
+        below = True
     elif op in [">", ">=", "gt", "ge"]:
-        diff = (data - threshold).clip(0)
+        below = False
     else:
         raise NotImplementedError(f"Condition not supported: '{op}'.")
 
-    if freq is not None:
-        diff = diff.resample(time=freq).sum(dim="time")
-
-    return to_agg_units(diff, data, op="delta_prod")
+    # Thresholds varying in space (but not in time) are broadcast against the data by the kernel,
+    # as long as the differences keep the data type of `data`
+    fixed_threshold = np.isscalar(threshold) or (
+        isinstance(threshold, xr.DataArray)
+        and "time" not in threshold.dims
+        and threshold.dtype == data.dtype
+    )
+    if (
+        freq is None
+        or not fixed_threshold
+        or data.dtype not in [np.float32, np.float64]
+        or (uses_dask(data) and len(data.chunks[data.get_axis_num("time")]) > 1)
+    ):
+        diff = (threshold - data if below else data - threshold).clip(0)
+        if freq is not None:
+            diff = diff.resample(time=freq).sum(dim="time")
+        return to_agg_units(diff, data, op="delta_prod")
+
+    if np.isscalar(threshold):
+        threshold = data.dtype.type(threshold)
+        dims = data.dims
+    else:
+        # Same order of dimensions as the arithmetic operations
+        first, second = (threshold, data) if below else (data, threshold)
+        dims = first.dims + tuple(d for d in second.dims if d not in first.dims)
+
+    # Differences and sum fused, each period receives its total directly
+    counts = _period_counts(data, freq)
+    ends = np.cumsum(counts.values)
+    diff = xr.apply_ufunc(
+        lambda arr, thresh, below, ends: _cumulative_difference_per_period(
+            arr, thresh, below, ends
+        ),
+        data,
+        threshold,
+        input_core_dims=[["time"], []],
+        output_core_dims=[["period"]],
+        kwargs={"below": below, "ends": ends},
+        join="inner",
+        dask="parallelized",
+        output_dtypes=[data.dtype],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    diff = diff.rename(period="time").assign_coords(time=counts.time)
+    return to_agg_units(diff.transpose(*dims), data, op="delta_prod")
 
 
 def first_day_threshold_reached(
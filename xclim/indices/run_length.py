@@ -12,11 +12,17 @@ from warnings import warn
 
 import numpy as np
 import xarray as xr
-from numba import njit
+from numba import boolean, float64, guvectorize, int64, njit
 from xarray.core.utils import get_temp_dimname
 
 from xclim.core.options import OPTIONS, RUN_LENGTH_UFUNC
-from xclim.core.utils import DateStr, DayOfYearStr, uses_dask
+from xclim.core.utils import (
+    DateStr,
+    DayOfYearStr,
+    _period_counts,
+    _time_component,
+    uses_dask,
+)
 
 npts_opt = 9000
 """
@@ -108,7 +114,38 @@ def resample_and_rl(
     xr.DataArray
       Output of compute resampled according to frequency {freq}.
     """
-    if resample_before_rl:
+    if resample_before_rl and compute is longest_run and da.dtype == bool:
+        # Faster vectorized equivalents, no need to split the array in groups
+        out = _longest_run_per_period(da, freq=freq, dim=dim)
+    elif (
+        resample_before_rl
+        and compute in [windowed_run_events, windowed_run_count]
+        and isinstance(kwargs.get("window"), int)
+        and da.dtype == bool
+        and not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+    ):
+        out = _windowed_run_per_period(
+            da,
+            window=kwargs["window"],
+            freq=freq,
+            dim=dim,
+            events=compute is windowed_run_events,
+        )
+    elif (
+        resample_before_rl
+        and compute in [windowed_run_events, windowed_run_count]
+        and kwargs.get("window") == 1
+        and da.dtype == bool
+    ):
+        if compute is windowed_run_events:
+            out = _run_events_per_period(da, freq=freq, dim=dim)
+        else:
+            # All True values are part of a run of at least one element
+            out = da.resample({dim: freq}).sum(dim=dim)
+        # Integers, unless there are empty periods, which are NaN
+        if (_period_counts(da, freq, dim) > 0).all():
+            out = out.astype(int)
+    elif resample_before_rl:
         out = da.resample({dim: freq}).map(
             compute, args=args, freq=None, dim=dim, **kwargs
         )
@@ -155,6 +192,306 @@ def _cumsum_reset_on_zero(
     return out
 
 
+@guvectorize(
+    [(boolean[:], int64[:], float64[:])],
+    "(n),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _longest_run_per_period_kernel(arr, ends, out):  # pragma: no cover
+    """Length of the longest run of True values of each period, NaN if the period is empty.
+
+    The periods are given by `ends`, the (exclusive) index of their last element.
+    """
+    start = 0
+    for p in range(ends.size):
+        out[p] = 0 if ends[p] > start else np.nan
+        run = 0
+        for i in range(start, ends[p]):
+            if arr[i]:
+                run += 1
+                if run > out[p]:
+                    out[p] = run
+            else:
+                run = 0
+        start = ends[p]
+
+
+@guvectorize(
+    [(boolean[:], float64[:])],
+    "(n)->()",
+    nopython=True,
+    cache=True,
+)
+def _longest_run_kernel(arr, out):  # pragma: no cover
+    """Length of the longest run of True values."""
+    out[0] = 0
+    run = 0
+    for i in range(arr.size):
+        if arr[i]:
+            run += 1
+            if run > out[0]:
+                out[0] = run
+        else:
+            run = 0
+
+
+def _longest_run_per_period(
+    da: xr.DataArray, freq: str, dim: str = "time"
+) -> xr.DataArray:
+    """Return the length of the longest run of True values within each period.
+
+    Runs are split at the period boundaries, as when resampling before the run length algorithm is applied.
+    Instead of iterating over the groups, all periods are scanned in a single pass with a `numba` kernel.
+    If `dim` is split across several dask chunks, the cumulative sum is reset on False values and on the first
+    element of each period, then the maximum is taken over each period.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        N-dimensional array (boolean).
+    freq : str
+        Resampling frequency.
+    dim : str
+        Dimension along which to find runs.
+
+    Returns
+    -------
+    xr.DataArray
+        Length of the longest run of True values within each period.
+    """
+    if not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1):
+        counts = _period_counts(da, freq, dim)
+        ends = np.cumsum(counts.values)
+        out = xr.apply_ufunc(
+            lambda arr, ends: _longest_run_per_period_kernel(arr, ends),
+            da,
+            input_core_dims=[[dim]],
+            output_core_dims=[["period"]],
+            kwargs={"ends": ends},
+            dask="parallelized",
+            output_dtypes=[np.float64],
+            dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+        )
+        out = out.rename(period=dim).assign_coords({dim: counts[dim]})
+        return out.transpose(*da.dims)
+
+    new_period = _period_starts(da[dim], freq)
+
+    da = da.astype(int)
+    # e.g. da == 110111|1101, the cumulative sum before each element is 011233|4556
+    cs = da.cumsum(dim=dim)
+    cs_before = cs.shift({dim: 1}, fill_value=0)
+    # Reset where da is False or a new period starts, e.g. 0NN3NN|4NN6 -> 000333|4446
+    cs_reset = cs_before.where((da == 0) | new_period).ffill(dim=dim)
+    # e.g. 110123|1201
+    return (cs - cs_reset).resample({dim: freq}).max(dim=dim)
+
+
+@guvectorize(
+    [(boolean[:], int64, boolean, int64[:], float64[:])],
+    "(n),(),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _windowed_run_per_period_kernel(arr, window, events, ends, out):  # pragma: no cover
+    """Number of runs (or of values in runs) of at least `window` True values of each period.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. Empty periods are NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        out[p] = 0 if ends[p] > start else np.nan
+        run = 0
+        for i in range(start, ends[p]):
+            if not arr[i]:
+                run = 0
+                continue
+            run += 1
+            if run == window:
+                out[p] += 1 if events else window
+            elif run > window and not events:
+                out[p] += 1
+        start = ends[p]
+
+
+def _windowed_run_per_period(
+    da: xr.DataArray, window: int, freq: str, dim: str = "time", events: bool = False
+) -> xr.DataArray:
+    """Return the number of values in runs of at least `window` True values within each period.
+
+    Runs are split at the period boundaries, as when resampling before the run length algorithm is applied.
+    All periods are scanned in a single pass with a `numba` kernel, instead of iterating over the groups.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        N-dimensional array (boolean).
+    window : int
+        Minimum run length.
+    freq : str
+        Resampling frequency.
+    dim : str
+        Dimension along which to find runs.
+    events : bool
+        If True, the number of runs is returned instead of the number of values part of these runs.
+
+    Returns
+    -------
+    xr.DataArray
+        Number of values in runs (or number of runs) of at least `window` True values within each period.
+        Integers, unless there are empty periods, which are NaN.
+    """
+    counts = _period_counts(da, freq, dim)
+    ends = np.cumsum(counts.values)
+    out = xr.apply_ufunc(
+        lambda arr, window, events, ends: _windowed_run_per_period_kernel(
+            arr, window, events, ends
+        ),
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[["period"]],
+        kwargs={"window": window, "events": events, "ends": ends},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    if (counts > 0).all():
+        out = out.astype(int)
+    out = out.rename(period=dim).assign_coords({dim: counts[dim]})
+    return out.transpose(*da.dims)
+
+
+def _run_events_per_period(
+    da: xr.DataArray, freq: str, dim: str = "time"
+) -> xr.DataArray:
+    """Return the number of runs of True values within each period.
+
+    Runs are split at the period boundaries, as when resampling before the run length algorithm is applied.
+    The starts of runs are found in a single vectorized pass and summed over each period.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        N-dimensional array (boolean).
+    freq : str
+        Resampling frequency.
+    dim : str
+        Dimension along which to find runs.
+
+    Returns
+    -------
+    xr.DataArray
+        Number of runs of True values within each period.
+    """
+    new_period = _period_starts(da[dim], freq)
+    starts = da & (~da.shift({dim: 1}, fill_value=False) | new_period)
+    return starts.resample({dim: freq}).sum(dim=dim)
+
+
+@guvectorize(
+    [(boolean[:], int64[:], boolean, float64[:])],
+    "(n),(m),()->(m)",
+    nopython=True,
+    cache=True,
+)
+def _boundary_index_per_period(arr, ends, last, out):  # pragma: no cover
+    """Index of the first (or last) True value of each period, NaN if there is none.
+
+    The periods are given by `ends`, the (exclusive) index of their last element.
+    As with the argmax of `first_run` for `window=1`, periods where all values are True are also NaN.
+    """
+    start = 0
+    for p in range(ends.size):
+        out[p] = np.nan
+        has_false = False
+        for i in range(start, ends[p]):
+            if not arr[i]:
+                has_false = True
+                break
+        if not has_false:
+            start = ends[p]
+            continue
+        if last:
+            for i in range(ends[p] - 1, start - 1, -1):
+                if arr[i]:
+                    out[p] = i
+                    break
+        else:
+            for i in range(start, ends[p]):
+                if arr[i]:
+                    out[p] = i
+                    break
+        start = ends[p]
+
+
+def _boundary_run_per_period(
+    da: xr.DataArray,
+    freq: str,
+    dim: str,
+    coord: str | bool | None,
+    position: str,
+) -> xr.DataArray:
+    """Return the index (or coordinate) of the first or last True value within each period.
+
+    Equivalent to resampling and finding the boundary of runs of at least one element in each group,
+    but all periods are scanned in a single pass with a `numba` kernel.
+
+    Parameters
+    ----------
+    da : xr.DataArray
+        N-dimensional array (boolean).
+    freq : str
+        Resampling frequency.
+    dim : str
+        Dimension along which to find runs.
+    coord : Optional[str]
+        If not False, the function returns values along `dim` instead of indexes.
+        If `dim` has a datetime dtype, `coord` can also be a str of the name of the
+        DateTimeAccessor object to use (ex: 'dayofyear').
+    position : {"first", "last"}
+        Determines if the algorithm finds the "first" or "last" True value.
+
+    Returns
+    -------
+    xr.DataArray
+        Index within the period (or coordinate if `coord` is not False) of the first (last) True value.
+        Returns np.nan if there are none, or if all values of the period are True.
+    """
+    counts = _period_counts(da, freq, dim)
+    ends = np.cumsum(counts.values)
+    out = xr.apply_ufunc(
+        lambda arr, ends, last: _boundary_index_per_period(arr, ends, last),
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[["period"]],
+        kwargs={"ends": ends, "last": position == "last"},
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    if coord:
+        crd = da[dim]
+        if isinstance(coord, str):
+            crd = getattr(crd.dt, coord)
+        out = lazy_indexing(crd, out)
+    else:
+        # Index within each period
+        out = out - xr.DataArray(ends - counts.values, dims=("period",))
+    out = out.rename(period=dim).assign_coords({dim: counts[dim]})
+    return out.transpose(*da.dims)
+
+
+def _period_starts(time: xr.DataArray, freq: str) -> xr.DataArray:
+    """Return a boolean array that is True on the first element of each resampling period."""
+    dim = time.dims[0]
+    ends = np.cumsum(_period_counts(time, freq, dim).values)
+    new_period = np.zeros(time.size, dtype=bool)
+    new_period[0] = True
+    new_period[ends[ends < time.size]] = True
+    return xr.DataArray(new_period, dims=(dim,), coords={dim: time})
+
+
 # TODO: Check if rle would be more performant with ffill/bfill instead of two times [{dim: slice(None, None, -1)}]
 def rle(
     da: xr.DataArray,
@@ -244,15 +581,14 @@ def rle_statistics(
     else:
         d = rle(da, dim=dim, index=index)
 
-        def get_rl_stat(d):
-            rl_stat = getattr(d.where(d >= window), reducer)(dim=dim)
-            rl_stat = xr.where((d.isnull() | (d < window)).all(dim=dim), 0, rl_stat)
-            return rl_stat
-
-        if freq is None:
-            rl_stat = get_rl_stat(d)
-        else:
-            rl_stat = d.resample({dim: freq}).map(get_rl_stat)
+        valid = d.where(d >= window)
+        no_runs = d.isnull() | (d < window)
+        if freq is not None:
+            # Reducing the resample objects directly avoids mapping a function over each group
+            valid = valid.resample({dim: freq})
+            no_runs = no_runs.resample({dim: freq})
+        rl_stat = getattr(valid, reducer)(dim=dim)
+        rl_stat = xr.where(no_runs.all(dim=dim), 0, rl_stat)
 
     return rl_stat
 
@@ -288,6 +624,20 @@ def longest_run(
     xr.DataArray, [int]
         Length of the longest run of True values along dimension (int).
     """
+    if (
+        freq is None
+        and da.dtype == bool
+        and not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+    ):
+        # All series are scanned at once, without building the run lengths of the whole array
+        return xr.apply_ufunc(
+            _longest_run_kernel,
+            da,
+            input_core_dims=[[dim]],
+            dask="parallelized",
+            output_dtypes=[np.float64],
+            keep_attrs=True,
+        )
     return rle_statistics(
         da,
         reducer="max",
@@ -336,7 +686,11 @@ def windowed_run_events(
     """
     ufunc_1dim = use_ufunc(ufunc_1dim, da, dim=dim, index=index, freq=freq)
 
-    if ufunc_1dim:
+    if ufunc_1dim or (
+        freq is None
+        and da.dtype == bool
+        and not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+    ):
         out = windowed_run_events_ufunc(da, window, dim)
 
     else:
@@ -397,6 +751,13 @@ def windowed_run_count(
     elif window == 1 and freq is None:
         out = da.sum(dim=dim)
 
+    elif (
+        freq is None
+        and da.dtype == bool
+        and not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+    ):
+        out = windowed_run_count_ufunc(da, window, dim)
+
     else:
         d = rle(da, dim=dim, index=index)
         d = d.where(d >= window, 0)
@@ -474,6 +835,17 @@ def _boundary_run(
         out = coord_transform(out, runs)
         return out
 
+    if (
+        window == 1
+        and freq is not None
+        and da.dtype == bool
+        and not (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+    ):
+        # All periods are scanned at once, instead of iterating over the resampling groups
+        return _boundary_run_per_period(
+            da, freq=freq, dim=dim, coord=coord, position=position
+        )
+
     ufunc_1dim = use_ufunc(ufunc_1dim, da, dim=dim, freq=freq)
 
     da = da.fillna(0)  # We expect a boolean array, but there could be NaNs nonetheless
@@ -872,11 +1244,57 @@ def season(
     return out
 
 
+@guvectorize(
+    [(boolean[:], int64, int64[:], boolean, int64[:], float64[:])],
+    "(n),(),(m),(),(m)->(m)",
+    nopython=True,
+    cache=True,
+)
+def _season_length_per_period(
+    arr, window, mids, has_date, ends, out
+):  # pragma: no cover
+    """Length of the season of each period, following :py:func:`season`.
+
+    The periods are given by `ends`, the (exclusive) index of their last element. `mids` is the index of the date
+    within each period, -1 if the period does not include it. If `has_date` is False, the season start is not
+    required to be before this date.
+    """
+    start = 0
+    for p in range(ends.size):
+        stop = ends[p]
+        out[p] = np.nan
+        if stop > start and mids[p] >= 0:
+            # Start : first run of `window` True values
+            beg = -1
+            run = 0
+            for i in range(start, stop):
+                run = run + 1 if arr[i] else 0
+                if run == window:
+                    beg = i - window + 1
+                    break
+            # End : first run of `window` False values after the start and the date
+            end = -1
+            run = 0
+            for i in range(max(beg, start + mids[p]), stop):
+                run = 0 if arr[i] else run + 1
+                if run == window:
+                    end = i - window + 1
+                    break
+            if beg < 0:
+                if end >= 0:
+                    out[p] = 0
+            elif not has_date or beg - start < mids[p]:
+                # Without an end, the season goes to the end of the period
+                out[p] = (end if end >= 0 else stop) - beg
+        start = stop
+
+
 def season_length(
     da: xr.DataArray,
     window: int,
     date: DayOfYearStr | None = None,
     dim: str = "time",
+    freq: str | None = None,
 ) -> xr.DataArray:
     """Return the length of the longest semi-consecutive run of True values (optionally including a given date).
 
@@ -894,6 +1312,8 @@ def season_length(
         The date (in MM-DD format) that a run must include to be considered valid.
     dim : str
         Dimension along which to calculate consecutive run (default: 'time').
+    freq : str, optional
+        Resampling frequency. If given, the season length is computed within each period.
 
     Returns
     -------
@@ -911,8 +1331,56 @@ def season_length(
     25 for all June, but July and august have very cold temperatures. Instead of returning 30 days (June), the function
     will return 61 days (July + June).
     """
-    seas = season(da, window, date, dim, coord=False)
-    return seas.length
+    if freq is None:
+        seas = season(da, window, date, dim, coord=False)
+        return seas.length
+
+    counts = _period_counts(da, freq, dim)
+    ends = np.cumsum(counts.values)
+    # Indexes of the date and the periods including them
+    idxs = index_of_date(da[dim], date) if date is not None else np.array([], int)
+    periods = np.searchsorted(ends, idxs, side="right")
+    if (
+        # With window=1, `first_run` finds no run in groups where all values are equal
+        window == 1
+        or da.dtype != bool
+        or (uses_dask(da) and len(da.chunks[da.get_axis_num(dim)]) > 1)
+        # Raises an error, as more than one date is found in a period
+        or np.unique(periods).size < periods.size
+    ):
+        return da.resample({dim: freq}).map(
+            season_length, window=window, date=date, dim=dim
+        )
+
+    if date is None:
+        mids = np.zeros(ends.size, dtype=int)
+    else:
+        mids = np.full(ends.size, -1)
+        mids[periods] = idxs - (ends - counts.values)[periods]
+    # All periods are scanned at once, instead of iterating over the resampling groups
+    out = xr.apply_ufunc(
+        lambda arr, window, mids, has_date, ends: _season_length_per_period(
+            arr, window, mids, has_date, ends
+        ),
+        da,
+        input_core_dims=[[dim]],
+        output_core_dims=[["period"]],
+        kwargs={
+            "window": window,
+            "mids": mids,
+            "has_date": date is not None,
+            "ends": ends,
+        },
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs={"output_sizes": {"period": ends.size}},
+    )
+    out = out.rename(period=dim).assign_coords({dim: counts[dim]})
+    out = out.rename("length").assign_attrs(
+        long_name="Length of the season.",
+        description="Number of steps of the original series in the season, between 'start' and 'end'.",
+    )
+    return out.transpose(*da.dims)
 
 
 def run_end_after_date(
@@ -1182,6 +1650,27 @@ def windowed_run_events_1d(arr: Sequence[bool], window: int) -> xr.DataArray:
     return (v * rl >= window).sum()
 
 
+@guvectorize(
+    [(boolean[:], int64, boolean, int64[:])],
+    "(n),(),()->()",
+    nopython=True,
+    cache=True,
+)
+def _windowed_run_kernel(arr, window, events, out):  # pragma: no cover
+    """Number of runs (or of values in runs) of at least `window` True values."""
+    out[0] = 0
+    run = 0
+    for i in range(arr.size):
+        if not arr[i]:
+            run = 0
+            continue
+        run += 1
+        if run == window:
+            out[0] += 1 if events else window
+        elif run > window and not events:
+            out[0] += 1
+
+
 def windowed_run_count_ufunc(
     x: xr.DataArray | Sequence[bool], window: int, dim: str
 ) -> xr.DataArray:
@@ -1201,6 +1690,17 @@ def windowed_run_count_ufunc(
     xr.DataArray
         A function operating along the time dimension of a dask-array.
     """
+    if getattr(x, "dtype", None) == bool:
+        # All series are scanned by the compiled kernel, instead of calling the 1D function on each of them
+        return xr.apply_ufunc(
+            lambda arr, window, events: _windowed_run_kernel(arr, window, events),
+            x,
+            input_core_dims=[[dim]],
+            kwargs={"window": window, "events": False},
+            dask="parallelized",
+            output_dtypes=[int],
+            keep_attrs=True,
+        )
     return xr.apply_ufunc(
         windowed_run_count_1d,
         x,
@@ -1232,6 +1732,17 @@ def windowed_run_events_ufunc(
     xr.DataArray
         A function operating along the time dimension of a dask-array.
     """
+    if getattr(x, "dtype", None) == bool:
+        # All series are scanned by the compiled kernel, instead of calling the 1D function on each of them
+        return xr.apply_ufunc(
+            lambda arr, window, events: _windowed_run_kernel(arr, window, events),
+            x,
+            input_core_dims=[[dim]],
+            kwargs={"window": window, "events": True},
+            dask="parallelized",
+            output_dtypes=[int],
+            keep_attrs=True,
+        )
     return xr.apply_ufunc(
         windowed_run_events_1d,
         x,
@@ -1418,16 +1929,24 @@ def index_of_date(
     """
     if date is None:
         return np.array([default])
+    dim = time.dims[0]
+    if dim in time.indexes:
+        # Cached for the time index
+        year, month, day = (
+            _time_component(time, c, dim) for c in ["year", "month", "day"]
+        )
+    else:
+        year, month, day = (
+            getattr(time.dt, c).values for c in ["year", "month", "day"]
+        )
     try:
         date = datetime.strptime(date, "%Y-%m-%d")
-        year_cond = time.dt.year == date.year
+        year_cond = year == date.year
     except ValueError:
         date = datetime.strptime(date, "%m-%d")
         year_cond = True
 
-    idxs = np.where(
-        year_cond & (time.dt.month == date.month) & (time.dt.day == date.day)
-    )[0]
+    idxs = np.where(year_cond & (month == date.month) & (day == date.day))[0]
     if max_idxs is not None and idxs.size > max_idxs:
         raise ValueError(
             f"More than {max_idxs} instance of date {date} found in the coordinate array."
@@ -74,6 +74,33 @@ def _fitfunc_1d(arr, *, dist, nparams, method, **fitkwargs):
     return params
 
 
+def _fitfunc_app(arr, *, dist, nparams):
+    """Fit distribution parameters with the approximate method, along the last axis of `arr`.
+
+    This computes the same estimates as :py:func:`_fitfunc_1d` for the `gamma` and `fisk` distributions, but for all
+    series at once.
+    """
+    valid = np.isfinite(arr)
+    pos = valid & (arr > 0)
+    npos = pos.sum(axis=-1)
+    x = np.where(pos, arr, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = np.where(pos, x, 0).sum(axis=-1) / npos
+        if dist == "gamma":
+            a = np.log(m) - np.where(pos, np.log(x), 0).sum(axis=-1) / npos
+            alpha = (1 + np.sqrt(1 + 4 * a / 3)) / (4 * a)
+            params = [alpha, np.zeros_like(m), m / alpha]
+        else:  # fisk
+            v = np.where(pos, x - m[..., np.newaxis], 0) ** 2
+            beta = (1 / 0.56) * (m / np.sqrt(v.sum(axis=-1) / npos) + 1 / 4)
+            params = [beta, np.zeros_like(m), m]
+    params = np.stack(params, axis=-1)
+
+    # Fill with NaNs if the series is too short or if one of the parameters is NaN
+    params[(valid.sum(axis=-1) <= 1) | np.isnan(params).any(axis=-1)] = np.nan
+    return params
+
+
 def fit(
     da: xr.DataArray,
     dist: str = "norm",
@@ -124,22 +151,28 @@ def fit(
     shape_params = [] if dc.shapes is None else dc.shapes.split(",")
     dist_params = shape_params + ["loc", "scale"]
 
+    if method == "APP" and dist in ["gamma", "fisk"] and not fitkwargs:
+        # Closed-form estimates, computed for all series at once
+        func, vectorize, kwargs = _fitfunc_app, False, dict(dist=dist)
+    else:
+        func, vectorize = _fitfunc_1d, True
+        kwargs = dict(
+            # Don't know how APP should be included, this works for now
+            dist=dc if method in ["ML", "APP"] else lm3dc,
+            method=method,
+            **fitkwargs,
+        )
+
     data = xr.apply_ufunc(
-        _fitfunc_1d,
+        func,
         da,
         input_core_dims=[[dim]],
         output_core_dims=[["dparams"]],
-        vectorize=True,
+        vectorize=vectorize,
         dask="parallelized",
         output_dtypes=[float],
         keep_attrs=True,
-        kwargs=dict(
-            # Don't know how APP should be included, this works for now
-            dist=dc if method in ["ML", "APP"] else lm3dc,
-            nparams=len(dist_params),
-            method=method,
-            **fitkwargs,
-        ),
+        kwargs=dict(nparams=len(dist_params), **kwargs),
         dask_gufunc_kwargs={"output_sizes": {"dparams": len(dist_params)}},
     )
 
@@ -508,8 +541,8 @@ def _dist_method_1D(
 
     Parameters
     ----------
-    params : 1D sequence of floats
-        Distribution parameters, in the same order as given by :py:func:`fit`.
+    params : array_like
+        Distribution parameters along the last axis, in the same order as given by :py:func:`fit`.
     arg : array_like, optional
         The argument for the requested function.
     dist : str
@@ -525,7 +558,9 @@ def _dist_method_1D(
         Same shape as arg in most cases.
     """
     dist = get_dist(dist)
-    args = ([arg] if arg is not None else []) + list(params)
+    params = np.asarray(params)
+    args = [arg] if arg is not None else []
+    args += [params[..., i] for i in range(params.shape[-1])]
     return getattr(dist, function)(*args, **kwargs)
 
 
@@ -574,7 +609,6 @@ def dist_method(
         input_core_dims=input_core_dims,
         output_core_dims=[[]],
         kwargs={"dist": fit_params.attrs["scipy_dist"], "function": function, **kwargs},
-        vectorize=True,
         output_dtypes=[float],
         dask="parallelized",
     )